@@ -1,12 +1,27 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from django.contrib import admin
 
 from net_maestro.core.models import EventFile
 
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+    from django.http import HttpRequest
+
 
 @admin.register(EventFile)
 class EventFileAdmin(admin.ModelAdmin):
     list_select_related = ["run"]
     list_display = ["id", "run__name", "uploaded", "file"]
     list_filter = ["run", "uploaded"]
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet[EventFile]:
+        # Only the name is shown from the joined Run; skip its description and status
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("run")
+            .only("id", "uploaded", "file", "run__name")
+        )
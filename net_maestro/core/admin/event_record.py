@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from django.contrib import admin
 
 from net_maestro.core.models import EventRecord
 
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+    from django.http import HttpRequest
+
 
 @admin.register(EventRecord)
 class EventRecordAdmin(admin.ModelAdmin):
@@ -24,3 +30,21 @@ class EventRecordAdmin(admin.ModelAdmin):
         "time_step",
         "event_type",
     ]
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet[EventRecord]:
+        # Only the file name is shown from the joined EventFile
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("event_file")
+            .only(
+                "id",
+                "event_file__file",
+                "source_lp",
+                "dest_lp",
+                "time_step",
+                "virtual_send",
+                "virtual_receive",
+                "event_type",
+            )
+        )
@@ -5,8 +5,10 @@ Create a new Run object in the database.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from celery import group
 from django.core.files import File
 import djclick as click
 
@@ -14,6 +16,18 @@ from net_maestro.core.constants import RunStatus
 from net_maestro.core.models import EventFile, Run
 from net_maestro.core.tasks.events import run_event_task
 
+# EventFile rows per INSERT statement
+EVENT_FILE_BATCH_SIZE = 500
+# Concurrent storage uploads; the work is I/O bound, so threads are enough
+UPLOAD_WORKERS = 8
+
+
+def _upload(event_file_obj: EventFile, path: Path) -> EventFile:
+    """Send a file to storage without saving the model row."""
+    with path.open("rb") as file_handle:
+        event_file_obj.file.save(path.name, File(file_handle), save=False)
+    return event_file_obj
+
 
 @click.command()
 @click.option(
@@ -36,6 +50,7 @@ from net_maestro.core.tasks.events import run_event_task
     "--event-file",
     "event_file",
     type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    multiple=True,
     help="Event file(s) to ingest. Can be provided multiple times.",
 )
 @click.option(
@@ -43,6 +58,7 @@ from net_maestro.core.tasks.events import run_event_task
     "--simulation-file",
     "simulation_file",
     type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    multiple=True,
     help="Simulation file(s) to ingest. Can be provided multiple times.",
 )
 @click.option(
@@ -50,6 +66,7 @@ from net_maestro.core.tasks.events import run_event_task
     "--model-file",
     "model_file",
     type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    multiple=True,
     help="Model file(s) to ingest. Can be provided multiple times.",
 )
 @click.option("--immediate", is_flag=True, help="Run the task immediately.")
@@ -57,9 +74,9 @@ def data_ingest(  # noqa: PLR0913
     *,
     name: str,
     description: str | None,
-    event_file: Path | None,
-    simulation_file: Path | None,
-    model_file: Path | None,
+    event_file: tuple[Path, ...],
+    simulation_file: tuple[Path, ...],
+    model_file: tuple[Path, ...],
     immediate: bool,
 ) -> None:
     """Create a new Run object in the database."""
@@ -76,14 +93,16 @@ def data_ingest(  # noqa: PLR0913
     )
 
     if event_file:
-        with event_file.open("rb") as file_handle:
-            event_file_obj = EventFile.objects.create(
-                run=new_run,
-                file=File(file_handle),
+        # Upload in parallel; database writes stay on this thread
+        with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as executor:
+            uploaded = list(
+                executor.map(_upload, [EventFile(run=new_run) for _ in event_file], event_file)
             )
+        event_file_objs = EventFile.objects.bulk_create(uploaded, batch_size=EVENT_FILE_BATCH_SIZE)
 
-        task = run_event_task.s(event_file_pk=event_file_obj.pk)
+        # Dispatch every parse task in a single group instead of one round-trip per file
+        tasks = group(run_event_task.s(event_file_pk=obj.pk) for obj in event_file_objs)
         if immediate:
-            task.apply()
+            tasks.apply()
         else:
-            task.delay()
+            tasks.apply_async()
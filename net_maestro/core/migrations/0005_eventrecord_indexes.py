@@ -0,0 +1,29 @@
+# Generated by Django 6.0.2 on 2026-10-14 19:01
+from __future__ import annotations
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0004_alter_run_description"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="eventrecord",
+            index=models.Index(
+                fields=["event_file", "time_step"], name="core_eventr_event_f_0efa06_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="eventrecord",
+            index=models.Index(
+                fields=["source_lp", "dest_lp"], name="core_eventr_source__51278a_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="eventrecord",
+            index=models.Index(fields=["event_type"], name="core_eventr_event_t_ad4829_idx"),
+        ),
+    ]
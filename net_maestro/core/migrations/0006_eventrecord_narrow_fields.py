@@ -0,0 +1,40 @@
+# Generated by Django 6.0.2 on 2026-10-14 19:02
+from __future__ import annotations
+
+from django.db import migrations, models
+
+import net_maestro.core.models.fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0005_eventrecord_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="eventrecord",
+            name="dest_lp",
+            field=models.IntegerField(),
+        ),
+        migrations.AlterField(
+            model_name="eventrecord",
+            name="event_type",
+            field=models.IntegerField(),
+        ),
+        migrations.AlterField(
+            model_name="eventrecord",
+            name="source_lp",
+            field=models.IntegerField(),
+        ),
+        migrations.AlterField(
+            model_name="eventrecord",
+            name="virtual_receive",
+            field=net_maestro.core.models.fields.Float32Field(),
+        ),
+        migrations.AlterField(
+            model_name="eventrecord",
+            name="virtual_send",
+            field=net_maestro.core.models.fields.Float32Field(),
+        ),
+    ]
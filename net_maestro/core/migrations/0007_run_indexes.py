@@ -0,0 +1,21 @@
+# Generated by Django 6.0.2 on 2026-10-14 19:03
+from __future__ import annotations
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0006_eventrecord_narrow_fields"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="run",
+            index=models.Index(fields=["-created"], name="core_run_created_4a0242_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="run",
+            index=models.Index(fields=["status", "-created"], name="core_run_status_086b67_idx"),
+        ),
+    ]
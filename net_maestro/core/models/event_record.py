@@ -3,17 +3,27 @@ from __future__ import annotations
 from django.db import models
 
 from net_maestro.core.models.event_file import EventFile
+from net_maestro.core.models.fields import Float32Field
 
 
 class EventRecord(models.Model):
     event_file = models.ForeignKey(EventFile, on_delete=models.CASCADE)
 
-    source_lp = models.FloatField()
-    dest_lp = models.FloatField()
+    # Widths match the event-trace binary format
+    source_lp = models.IntegerField()
+    dest_lp = models.IntegerField()
     time_step = models.IntegerField()
-    event_type = models.FloatField()
-    virtual_send = models.FloatField()
-    virtual_receive = models.FloatField()
+    event_type = models.IntegerField()
+    virtual_send = Float32Field()
+    virtual_receive = Float32Field()
+
+    class Meta:
+        # Back the admin list filters and per-file time-step ordering
+        indexes = [
+            models.Index(fields=["event_file", "time_step"]),
+            models.Index(fields=["source_lp", "dest_lp"]),
+            models.Index(fields=["event_type"]),
+        ]
 
     def __str__(self) -> str:
         return f"EventRecord {self.id}"
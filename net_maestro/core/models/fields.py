@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db import models
+
+if TYPE_CHECKING:
+    from django.db.backends.base.base import BaseDatabaseWrapper
+
+
+class Float32Field(models.FloatField):
+    """Single-precision float, for values that are 32-bit in the source binary format."""
+
+    def db_type(self, connection: BaseDatabaseWrapper) -> str:
+        return "real"
@@ -11,5 +11,12 @@ class Run(models.Model):
     description = models.TextField(blank=True, default="")
     status = models.CharField(max_length=20, choices=RunStatus, default=RunStatus.PENDING)
 
+    class Meta:
+        # Back the admin's newest-first listing, optionally filtered by status
+        indexes = [
+            models.Index(fields=["-created"]),
+            models.Index(fields=["status", "-created"]),
+        ]
+
     def __str__(self):
         return f"Run {self.id}: {self.name} ({self.status})"
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+import mmap
 from typing import TYPE_CHECKING, Any, Protocol
 
 import pandas as pd
 
+from .schema import map_file
+
 if TYPE_CHECKING:
     from pathlib import Path
     import struct
@@ -24,7 +27,7 @@ class HeaderTuple(Protocol):
 
 
 ParseResult = tuple[int, pd.DataFrame | None, str | None, list[str] | None]
-PayloadHandler = Callable[[bytes, int, HeaderTuple], ParseResult]
+PayloadHandler = Callable[[bytes | mmap.mmap, int, HeaderTuple], ParseResult]
 
 
 class BaseBinaryReader:
@@ -41,31 +44,37 @@ class BaseBinaryReader:
         sample_size_index: int,
         payloads: dict[int, PayloadHandler],
     ) -> None:
-        with filename.open("rb") as f:
-            self.content: bytes = f.read()
+        self.content: bytes | mmap.mmap = map_file(filename)
         self.header_struct = header_struct
         self.sample_size_index = sample_size_index
         self.payloads = payloads
 
+    def close(self) -> None:
+        """Release the memory-mapped file, if one was opened."""
+        if isinstance(self.content, mmap.mmap):
+            self.content.close()
+
     def read(self) -> dict[str, pd.DataFrame]:
         frames: dict[str, list[pd.DataFrame]] = {}
+        # Payloads are interleaved with headers, so iter_unpack does not apply; bind the
+        # per-record lookups once instead
+        content = self.content
+        unpack_from = self.header_struct.unpack_from
+        header_size = self.header_struct.size
+        sample_size_index = self.sample_size_index
+        get_handler = self.payloads.get
         offset = 0
-        n = len(self.content)
-
-        while offset < n:
-            if offset + self.header_struct.size > n:
-                break
+        n = len(content)
 
-            header_tuple = self.header_struct.unpack_from(self.content, offset)
-            offset += self.header_struct.size
-            sample_size = int(header_tuple[self.sample_size_index])
-            handler = self.payloads.get(sample_size)
+        while offset + header_size <= n:
+            header_tuple = unpack_from(content, offset)
+            offset += header_size
+            handler = get_handler(int(header_tuple[sample_size_index]))
             if handler is None:
                 break
 
-            new_offset, df, label, _time_cols = handler(self.content, offset, header_tuple)
-            offset = new_offset
+            offset, df, label, _time_cols = handler(content, offset, header_tuple)
             if df is not None and label is not None:
                 frames.setdefault(label, []).append(df)
 
-        return {k: pd.concat(v) if v else pd.DataFrame() for k, v in frames.items()}
+        return {k: v[0] if len(v) == 1 else pd.concat(v) for k, v in frames.items()}
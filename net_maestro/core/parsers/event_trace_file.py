@@ -1,20 +1,26 @@
 from __future__ import annotations
 
+from functools import cache
 import logging
+import mmap
 from pathlib import Path
 import struct
 from struct import Struct
 from typing import TYPE_CHECKING, NamedTuple, TypedDict
 
+import numpy as np
 import pandas as pd
 
-from .schema import ENDIAN, infer_endian, validate_time_columns
+from .schema import ENDIAN, gather_records, infer_endian, map_file, min_max, struct_dtype
 
 if TYPE_CHECKING:
     from collections.abc import Generator
 
 logger = logging.getLogger(__name__)
 
+# Returned while nothing has been read, instead of allocating a new empty frame per access
+_EMPTY_DF = pd.DataFrame()
+
 # Metadata
 META_FIELDS = (
     "source_lp",
@@ -65,10 +71,42 @@ def _sp2p_format(endian: str) -> str:
     return f"{endian}i"
 
 
+KNOWN_PAYLOAD_SIZES = frozenset(struct.calcsize(_sp2p_format(e)) for e in ("<", ">"))
+
+
+@cache
+def _record_layout(endian: str) -> tuple[Struct, Struct, np.dtype]:
+    """Compiled header and payload structs, and the combined record dtype, for a byte order."""
+    return (
+        Struct(_meta_format(endian)),
+        Struct(_sp2p_format(endian)),
+        # One metadata header immediately followed by its SimpleP2P payload; real_times is never
+        # used, so it is skipped at view time rather than materialized
+        struct_dtype(
+            (_meta_format(endian), META_FIELDS),
+            (_sp2p_format(endian), SIMPLEP2P_FIELDS),
+            skip=("real_times",),
+        ),
+    )
+
+
 DEFAULT_TIME_KEY = "virtual_send"
 ALT_TIME_KEY = "virtual_receive"
 TIME_COLUMNS = [DEFAULT_TIME_KEY, ALT_TIME_KEY]
 
+# Columns (in order) and dtypes of the parsed event-record DataFrame, at the widths the binary
+# format stores them
+EVENT_RECORD_DTYPES: dict[str, type[np.generic]] = {
+    "source_lp": np.uint32,
+    "dest_lp": np.uint32,
+    "virtual_send": np.float32,
+    "virtual_receive": np.float32,
+    "event_type": np.int32,
+    "time_step": np.int32,
+}
+# Columns decoded from the record itself; time_step is the record's position
+EVENT_RECORD_FIELDS = tuple(EVENT_RECORD_DTYPES)[:-1]
+
 
 class EventFileParser:
     """Parser for event-trace binary files.
@@ -77,24 +115,22 @@ class EventFileParser:
     The header's sample_size selects the payload layout.
     """
 
-    def __init__(self, source: Path | bytes) -> None:
-        if isinstance(source, Path):
-            with source.open("rb") as f:
-                self.content = f.read()
-        else:
-            self.content = source
+    def __init__(self, source: Path | bytes, endian: str | None = None) -> None:
+        self.content: bytes | mmap.mmap = map_file(source) if isinstance(source, Path) else source
 
-        # Detect endianness from first header
-        known_payload_sizes = {struct.calcsize(_sp2p_format(e)) for e in ("<", ">")}
-        detected_endian = infer_endian(
-            _meta_format, SAMPLE_SIZE_INDEX, self.content, known_payload_sizes
-        )
+        # Detect endianness from first header, unless the caller already knows it
+        if endian is None:
+            endian = infer_endian(
+                _meta_format, SAMPLE_SIZE_INDEX, self.content, set(KNOWN_PAYLOAD_SIZES)
+            )
 
-        self.metadata_struct: Struct = Struct(_meta_format(detected_endian))
+        self.metadata_struct: Struct
+        self.simplep2p_struct: Struct
+        self.record_dtype: np.dtype
+        self.metadata_struct, self.simplep2p_struct, self.record_dtype = _record_layout(endian)
         self.metadata_size: int = META_STRUCT.size
 
         # TODO: will need to figure out a way to not hardcode this
-        self.simplep2p_struct: Struct = Struct(_sp2p_format(detected_endian))
         self.simplep2p_size: int = SIMPLEP2P_STRUCT.size
 
         self._use_send_time: bool = True
@@ -103,60 +139,113 @@ class EventFileParser:
         self._simplep2p_df: pd.DataFrame | None = None
         self._min_time: float | None = None
         self._max_time: float | None = None
+        self._network_df_cache: (
+            tuple[pd.DataFrame, tuple[str, float, float], pd.DataFrame] | None
+        ) = None
+        self._sorted_time_cache: tuple[pd.DataFrame, dict[str, bool]] | None = None
+
+    def close(self) -> None:
+        """Release the memory-mapped file, if one was opened."""
+        if isinstance(self.content, mmap.mmap):
+            self.content.close()
+
+    def parse_event_columns(self) -> dict[str, np.ndarray]:
+        """Decode every event record into one array per EventRecordDict field, in field order."""
+        records = self._simplep2p_records()
+        columns = {name: records[name] for name in EVENT_RECORD_FIELDS}
+        columns["time_step"] = np.arange(len(records), dtype=EVENT_RECORD_DTYPES["time_step"])
+        return columns
 
     def parse_event_records(self) -> Generator[EventRecordDict]:
         """Yield individual event records as typed dicts."""
+        # Decode with NumPy, then convert each column to Python scalars in one C-level pass
+        columns = [column.tolist() for column in self.parse_event_columns().values()]
+        for source_lp, dest_lp, virtual_send, virtual_receive, event_type, time_step in zip(
+            *columns, strict=True
+        ):
+            yield {
+                "source_lp": source_lp,
+                "dest_lp": dest_lp,
+                "virtual_send": virtual_send,
+                "virtual_receive": virtual_receive,
+                "event_type": event_type,
+                "time_step": time_step,
+            }
+
+    def _simplep2p_records(self) -> np.ndarray:
+        """Decode every SimpleP2P record in the content into a structured array.
+
+        Content made up only of SimpleP2P records is viewed in place. Otherwise only the header
+        sample sizes are walked: zero-length payloads are skipped, and the walk stops at the
+        first unknown or truncated payload. The records found are then gathered out of the
+        buffer in one pass.
+        """
+        content = self.content
+        record_size = self.record_dtype.itemsize
+        if content and not len(content) % record_size:
+            records = np.frombuffer(content, dtype=self.record_dtype)
+            if np.all(records["sample_size"] == self.simplep2p_size):
+                return records
+
+        n = len(content)
+        metadata_size = self.metadata_size
+        simplep2p_size = self.simplep2p_size
+        # sample_size is the last header field
+        header_format = self.metadata_struct.format
+        size_offset = struct.calcsize(header_format[:-1])
+        unpack_size = Struct(header_format[0] + header_format[-1]).unpack_from
+        offsets: list[int] = []
         byte_pos = 0
-        time_step = 0
-
-        while byte_pos + self.metadata_size <= len(self.content):
-            metadata_tuple = self.metadata_struct.unpack_from(self.content, byte_pos)
-            byte_pos += self.metadata_size
-            metadata = META(*metadata_tuple)
-
-            if metadata.sample_size == self.simplep2p_size and (
-                byte_pos + self.simplep2p_size <= len(self.content)
-            ):
-                sp_tuple = self.simplep2p_struct.unpack_from(self.content, byte_pos)
-                byte_pos += self.simplep2p_size
-                sp_data = SimpleP2P(*sp_tuple)
-
-                yield {
-                    "source_lp": metadata.source_lp,
-                    "dest_lp": metadata.dest_lp,
-                    "virtual_send": metadata.virtual_send,
-                    "virtual_receive": metadata.virtual_receive,
-                    "event_type": sp_data.event_type,
-                    "time_step": time_step,
-                }
-                time_step += 1
-            elif metadata.sample_size == 0:
-                # Zero-length payload, skip
-                continue
+
+        while byte_pos + metadata_size <= n:
+            (sample_size,) = unpack_size(content, byte_pos + size_offset)
+            if sample_size == simplep2p_size and byte_pos + record_size <= n:
+                offsets.append(byte_pos)
+                byte_pos += record_size
+            elif sample_size == 0:
+                byte_pos += metadata_size
             else:
-                remaining = len(self.content) - byte_pos
                 logger.warning(
                     "Stopping parse due to invalid payload size: size=%d, remaining=%d",
-                    metadata.sample_size,
-                    remaining,
+                    sample_size,
+                    n - byte_pos - metadata_size,
                 )
                 break
 
+        return gather_records(content, offsets, self.record_dtype)
+
     def read(self) -> None:
         """Parse the entire file and build a DataFrame.
 
-        Uses parse_event_records() generator to build the DataFrame for
-        visualization and analysis purposes.
+        Records are decoded with NumPy rather than one struct call per record, and the
+        DataFrame is built once for visualization and analysis purposes.
         """
-        records = list(self.parse_event_records())
-
-        if records:
-            self.simplep2p_df = validate_time_columns(pd.DataFrame(records), TIME_COLUMNS)
-            if not self.simplep2p_df.empty:
-                self.min_time = float(self.simplep2p_df[self.time_variable].min())
-                self.max_time = float(self.simplep2p_df[self.time_variable].max())
-        else:
+        records = self._simplep2p_records()
+        if not records.size:
             self.simplep2p_df = pd.DataFrame()
+            return
+
+        # Validate and take the time range on the raw arrays, so the frame is only built once
+        time_step = np.arange(len(records), dtype=EVENT_RECORD_DTYPES["time_step"])
+        valid = np.isfinite(records["virtual_send"]) & np.isfinite(records["virtual_receive"])
+        all_valid = bool(valid.all())
+        if not all_valid:
+            records = records[valid]
+            time_step = time_step[valid]
+
+        times = records[self.time_variable]
+        if times.size:
+            self.min_time, self.max_time = min_max(times)
+
+        # One contiguous array per column; when rows were dropped, the time steps double as
+        # the index, as with validate_time_columns() on a record-by-record frame
+        columns = {
+            name: records[name].astype(EVENT_RECORD_DTYPES[name]) for name in EVENT_RECORD_FIELDS
+        }
+        columns["time_step"] = time_step
+        self.simplep2p_df = pd.DataFrame(
+            columns, index=None if all_valid else time_step, copy=False
+        )
 
     @property
     def max_time(self) -> float | None:
@@ -184,10 +273,7 @@ class EventFileParser:
 
     @property
     def simplep2p_df(self) -> pd.DataFrame:
-        if self._simplep2p_df is None:
-            return pd.DataFrame()
-
-        return self._simplep2p_df
+        return _EMPTY_DF if self._simplep2p_df is None else self._simplep2p_df
 
     @simplep2p_df.setter
     def simplep2p_df(self, df: pd.DataFrame) -> None:
@@ -195,22 +281,51 @@ class EventFileParser:
 
     @property
     def network_df(self) -> pd.DataFrame:
-        if self.simplep2p_df.empty or self.min_time is None or self.max_time is None:
+        df = self._simplep2p_df
+        if df is None or df.empty or self._min_time is None or self._max_time is None:
             return pd.DataFrame()
 
-        return self.simplep2p_df[
-            (self.simplep2p_df[self.time_variable] >= self.min_time)
-            & (self.simplep2p_df[self.time_variable] <= self.max_time)
-        ]
+        # Reuse the last slice while the frame and time range are unchanged. Callers get a
+        # shallow copy, so adding or replacing columns does not change what later calls return
+        key = (self._time_variable, self._min_time, self._max_time)
+        if self._network_df_cache is not None:
+            cached_df, cached_key, cached_slice = self._network_df_cache
+            if cached_df is df and cached_key == key:
+                return cached_slice.copy(deep=False)
+
+        times = df[self._time_variable].to_numpy()
+        if self._time_is_sorted(df):
+            # A sorted time column is sliced by binary search instead of scanned
+            start = np.searchsorted(times, self._min_time, side="left")
+            stop = np.searchsorted(times, self._max_time, side="right")
+            network_df = df.iloc[start:stop]
+        else:
+            # numexpr is not a dependency; fuse the comparisons in place on the raw column
+            mask = times >= self._min_time
+            np.logical_and(mask, times <= self._max_time, out=mask)
+            network_df = df[mask]
+        self._network_df_cache = (df, key, network_df)
+        return network_df.copy(deep=False)
+
+    def _time_is_sorted(self, df: pd.DataFrame) -> bool:
+        """Whether the active time column of df is non-decreasing, checked once per frame."""
+        if self._sorted_time_cache is None or self._sorted_time_cache[0] is not df:
+            self._sorted_time_cache = (df, {})
+        checked = self._sorted_time_cache[1]
+        if self._time_variable not in checked:
+            checked[self._time_variable] = bool(df[self._time_variable].is_monotonic_increasing)
+        return checked[self._time_variable]
 
     def reset_time_range(self) -> None:
-        if self.simplep2p_df.empty:
+        df = self._simplep2p_df
+        if df is None or df.empty:
             self.min_time = None
             self.max_time = None
             return
 
-        self.min_time = float(self.simplep2p_df[self.time_variable].min())
-        self.max_time = float(self.simplep2p_df[self.time_variable].max())
+        # Reduce the raw array in one pass, bypassing pandas' reduction dispatch
+        times = df[self._time_variable].to_numpy()
+        self.min_time, self.max_time = min_max(times)
 
     @property
     def use_send_time(self) -> bool:
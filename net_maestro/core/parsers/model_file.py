@@ -1,19 +1,26 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import mmap
 import struct
 from struct import Struct
 from typing import TYPE_CHECKING, NamedTuple
 
+import numpy as np
 import pandas as pd
 
-from .schema import ENDIAN, validate_time_columns
+from .schema import ENDIAN, closing_mapped, map_file, min_max, struct_dtype, validate_time_columns
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Returned while nothing has been read, instead of allocating a new empty frame per access
+_EMPTY_DF = pd.DataFrame()
+
 # Metadata
 META_FIELDS = ("lp_id", "kp_id", "pe_id", "virtual_time", "real_time", "sample_size", "flag")
 META_FORMAT = f"{ENDIAN}QLLddii"
@@ -62,13 +69,27 @@ DEFAULT_TIME_KEY = "virtual_time"
 ALT_TIME_KEY = "real_time"
 TIME_COLUMNS = [DEFAULT_TIME_KEY, ALT_TIME_KEY]
 
+# Columns (in order) and dtypes of the parsed model DataFrame. The binary format already uses
+# 64-bit fields; only the unsigned ids differ from pandas' int64 default.
+MODEL_RECORD_DTYPES: dict[str, type[np.generic]] = {
+    "component_id": np.uint64,
+    "send_count": np.int64,
+    "send_bytes": np.int64,
+    "send_time": np.float64,
+    "receive_count": np.int64,
+    "receive_bytes": np.int64,
+    "receive_time": np.float64,
+    "lp_id": np.uint64,
+    "virtual_time": np.float64,
+    "real_time": np.float64,
+}
+
 
 class ModelFile:
     """Parser for model analysis Logical Process (LP) binary files."""
 
     def __init__(self, filename: Path) -> None:
-        with filename.open("rb") as f:
-            self.content: bytes = f.read()
+        self.content: bytes | mmap.mmap = map_file(filename)
 
         self.metadata_struct: Struct = META_STRUCT
         self.metadata_size: int = META_STRUCT.size
@@ -77,51 +98,75 @@ class ModelFile:
         self.simplep2p_struct: Struct = SIMPLEP2P_STRUCT
         self.simplep2p_size: int = SIMPLEP2P_STRUCT.size
 
+        # One metadata header immediately followed by its SimpleP2P payload
+        self.record_dtype: np.dtype = struct_dtype(
+            (META_FORMAT, META_FIELDS), (SIMPLEP2P_FORMAT, SIMPLEP2P_FIELDS)
+        )
+
         self._use_virtual_time: bool = True
         self._time_variable: str = DEFAULT_TIME_KEY
 
         self._simplep2p_df: pd.DataFrame | None = None
         self._min_time: float | None = None
         self._max_time: float | None = None
+        self._network_df_cache: (
+            tuple[pd.DataFrame, tuple[str, float, float], pd.DataFrame] | None
+        ) = None
+        self._sorted_time_cache: tuple[pd.DataFrame, dict[str, bool]] | None = None
+
+    def close(self) -> None:
+        """Release the memory-mapped file, if one was opened."""
+        if isinstance(self.content, mmap.mmap):
+            self.content.close()
+
+    def _simplep2p_records(self) -> np.ndarray:
+        """Decode the leading run of model data records into a structured array.
+
+        Parsing stops at the first record that is not model data or whose payload size is
+        unknown, and at a trailing partial record.
+        """
+        content = self.content
+        record_size = self.record_dtype.itemsize
+        count = len(content) // record_size
+        records = np.frombuffer(content, dtype=self.record_dtype, count=count)
+
+        valid = (records["flag"] == FLAG_MODEL_DATA) & (
+            records["sample_size"] == self.simplep2p_size
+        )
+        stop = count if valid.all() else int(valid.argmin())
+        stop_pos = stop * record_size
+        if stop_pos + self.metadata_size <= len(content):
+            # Either an invalid record or a header whose payload is cut off
+            metadata = META(*self.metadata_struct.unpack_from(content, stop_pos))
+            logger.warning(
+                "Stopping parse due to invalid payload size: size=%d, remaining=%d",
+                metadata.sample_size,
+                len(content) - stop_pos - self.metadata_size,
+            )
+        return records[:stop]
 
     def read(self) -> None:
-        sample_list: list[pd.DataFrame] = []
-        byte_pos = 0
-
-        while byte_pos + self.metadata_size <= len(self.content):
-            metadata_tuple = self.metadata_struct.unpack_from(self.content, byte_pos)
-            byte_pos += self.metadata_size
-            metadata = META(*metadata_tuple)
-
-            if (
-                metadata.flag == FLAG_MODEL_DATA
-                and metadata.sample_size == self.simplep2p_size
-                and (byte_pos + self.simplep2p_size) <= len(self.content)
-            ):
-                sp_tuple = self.simplep2p_struct.unpack_from(self.content, byte_pos)
-                byte_pos += self.simplep2p_size
-                sp_data = SimpleP2P(*sp_tuple)
-                df = pd.DataFrame([sp_data])
-                df["lp_id"] = metadata.lp_id
-                df["virtual_time"] = metadata.virtual_time
-                df["real_time"] = metadata.real_time
-                sample_list.append(df)
-            else:
-                # Unknown payload size or flag
-                remaining = len(self.content) - byte_pos
-                logger.warning(
-                    "Stopping parse due to invalid payload size: size=%d, remaining=%d",
-                    metadata.sample_size,
-                    remaining,
-                )
-                break
-
-        self.simplep2p_df = validate_time_columns(
-            pd.concat(sample_list, ignore_index=True), TIME_COLUMNS
+        """Parse the entire file and build a DataFrame.
+
+        Records are decoded in a single vectorized pass and the DataFrame is built once from
+        per-column arrays.
+        """
+        records = self._simplep2p_records()
+        if not records.size:
+            self._set_simplep2p_df(pd.DataFrame())
+            return
+
+        self._set_simplep2p_df(
+            pd.DataFrame(
+                {name: records[name].astype(dtype) for name, dtype in MODEL_RECORD_DTYPES.items()},
+                copy=False,
+            )
         )
+
+    def _set_simplep2p_df(self, df: pd.DataFrame) -> None:
+        self.simplep2p_df = validate_time_columns(df, TIME_COLUMNS)
         if not self.simplep2p_df.empty:
-            self.min_time = float(self.simplep2p_df[self.time_variable].min())
-            self.max_time = float(self.simplep2p_df[self.time_variable].max())
+            self.reset_time_range()
 
     @property
     def max_time(self) -> float | None:
@@ -149,10 +194,7 @@ class ModelFile:
 
     @property
     def simplep2p_df(self) -> pd.DataFrame:
-        if self._simplep2p_df is None:
-            return pd.DataFrame()
-
-        return self._simplep2p_df
+        return _EMPTY_DF if self._simplep2p_df is None else self._simplep2p_df
 
     @simplep2p_df.setter
     def simplep2p_df(self, df: pd.DataFrame) -> None:
@@ -160,22 +202,51 @@ class ModelFile:
 
     @property
     def network_df(self) -> pd.DataFrame:
-        if self.simplep2p_df.empty or self.min_time is None or self.max_time is None:
+        df = self._simplep2p_df
+        if df is None or df.empty or self._min_time is None or self._max_time is None:
             return pd.DataFrame()
 
-        return self.simplep2p_df[
-            (self.simplep2p_df[self.time_variable] >= self.min_time)
-            & (self.simplep2p_df[self.time_variable] <= self.max_time)
-        ]
+        # Reuse the last slice while the frame and time range are unchanged. Callers get a
+        # shallow copy, so adding or replacing columns does not change what later calls return
+        key = (self._time_variable, self._min_time, self._max_time)
+        if self._network_df_cache is not None:
+            cached_df, cached_key, cached_slice = self._network_df_cache
+            if cached_df is df and cached_key == key:
+                return cached_slice.copy(deep=False)
+
+        times = df[self._time_variable].to_numpy()
+        if self._time_is_sorted(df):
+            # A sorted time column is sliced by binary search instead of scanned
+            start = np.searchsorted(times, self._min_time, side="left")
+            stop = np.searchsorted(times, self._max_time, side="right")
+            network_df = df.iloc[start:stop]
+        else:
+            # numexpr is not a dependency; fuse the comparisons in place on the raw column
+            mask = times >= self._min_time
+            np.logical_and(mask, times <= self._max_time, out=mask)
+            network_df = df[mask]
+        self._network_df_cache = (df, key, network_df)
+        return network_df.copy(deep=False)
+
+    def _time_is_sorted(self, df: pd.DataFrame) -> bool:
+        """Whether the active time column of df is non-decreasing, checked once per frame."""
+        if self._sorted_time_cache is None or self._sorted_time_cache[0] is not df:
+            self._sorted_time_cache = (df, {})
+        checked = self._sorted_time_cache[1]
+        if self._time_variable not in checked:
+            checked[self._time_variable] = bool(df[self._time_variable].is_monotonic_increasing)
+        return checked[self._time_variable]
 
     def reset_time_range(self) -> None:
-        if self.simplep2p_df.empty:
+        df = self._simplep2p_df
+        if df is None or df.empty:
             self.min_time = None
             self.max_time = None
             return
 
-        self.min_time = float(self.simplep2p_df[self.time_variable].min())
-        self.max_time = float(self.simplep2p_df[self.time_variable].max())
+        # Reduce the raw array in one pass, bypassing pandas' reduction dispatch
+        times = df[self._time_variable].to_numpy()
+        self.min_time, self.max_time = min_max(times)
 
     @property
     def use_virtual_time(self) -> bool:
@@ -186,3 +257,20 @@ class ModelFile:
         self._use_virtual_time = flag
         self.time_variable = "virtual_time" if flag else "real_time"
         self.reset_time_range()
+
+
+def _read_model_file(filename: Path) -> ModelFile:
+    # read() copies the records out, so the mapping is not kept open for every file
+    with closing_mapped(ModelFile(filename)) as model_file:
+        model_file.read()
+    return model_file
+
+
+def parse_many(filenames: Iterable[Path], max_workers: int | None = None) -> list[ModelFile]:
+    """Read several model files concurrently, returning them in input order, already closed.
+
+    Decoding is NumPy work that releases the GIL, so threads are used; the parsed frames are
+    shared with the caller directly instead of being pickled back from worker processes.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_read_model_file, filenames))
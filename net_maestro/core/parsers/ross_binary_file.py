@@ -1,17 +1,30 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 import logging
+import mmap
+import multiprocessing
 import struct
 from struct import Struct
-from typing import TYPE_CHECKING, NamedTuple
+from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
-from .schema import ENDIAN, validate_time_columns
+from .schema import (
+    ENDIAN,
+    closing_mapped,
+    gather_records,
+    map_file,
+    struct_dtype,
+    validate_time_columns,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from pathlib import Path
 
+
 logger = logging.getLogger(__name__)
 
 # Metadata
@@ -19,14 +32,6 @@ META_FIELDS = ("flag", "sample_size", "virtual_time", "real_time")
 META_FORMAT = f"{ENDIAN}2i2d"
 META_STRUCT = struct.Struct(META_FORMAT)
 
-
-class META(NamedTuple):
-    flag: int
-    sample_size: int
-    virtual_time: float
-    real_time: float
-
-
 # Payload structs
 PE_FORMAT = f"{ENDIAN}13I13f"
 PE_STRUCT = struct.Struct(PE_FORMAT)
@@ -59,36 +64,6 @@ PE_FIELDS = (
     "lz4_time",
 )
 
-
-class PE(NamedTuple):
-    PE_ID: int
-    events_processed: int
-    events_aborted: int
-    events_rolled_back: int
-    total_rollbacks: int
-    secondary_rollbacks: int
-    fossil_collection_attempts: int
-    pq_queue_size: int
-    network_sends: int
-    network_reads: int
-    number_gvt: int
-    pe_event_ties: int
-    all_reduce: int
-    efficiency: float
-    network_read_time: float
-    network_other_time: float
-    gvt_time: float
-    fossil_collect_time: float
-    event_abort_time: float
-    event_process_time: float
-    pq_time: float
-    rollback_time: float
-    cancel_q_time: float
-    avl_time: float
-    buddy_time: float
-    lz4_time: float
-
-
 KP_FORMAT = f"{ENDIAN}9I2f"
 KP_STRUCT = struct.Struct(KP_FORMAT)
 KP_FIELDS = (
@@ -106,20 +81,6 @@ KP_FIELDS = (
 )
 
 
-class KP(NamedTuple):
-    PE_ID: int
-    KP_ID: int
-    events_processed: int
-    events_abort: int
-    events_rolled_back: int
-    total_rollbacks: int
-    secondary_rollbacks: int
-    network_sends: int
-    network_reads: int
-    time_ahead_gvt: float
-    efficiency: float
-
-
 # More explicit name for "LP"
 LP_FORMAT = f"{ENDIAN}8If"
 LP_STRUCT = struct.Struct(LP_FORMAT)
@@ -136,24 +97,31 @@ LP_FIELDS = (
 )
 
 
-class LP(NamedTuple):
-    PE_ID: int
-    KP_ID: int
-    LP_ID: int
-    events_processed: int
-    events_abort: int
-    events_rolled_back: int
-    network_sends: int
-    network_reads: int
-    efficiency: float
-
-
 # Default Values
 DEFAULT_TIME_KEY = "virtual_time"
 ALT_TIME_KEY = "real_time"
 TIME_COLUMNS = [DEFAULT_TIME_KEY, ALT_TIME_KEY]
 
 
+# Header followed by payload, as each record is laid out on disk
+PE_RECORD_DTYPE = struct_dtype((META_FORMAT, META_FIELDS), (PE_FORMAT, PE_FIELDS))
+KP_RECORD_DTYPE = struct_dtype((META_FORMAT, META_FIELDS), (KP_FORMAT, KP_FIELDS))
+LP_RECORD_DTYPE = struct_dtype((META_FORMAT, META_FIELDS), (LP_FORMAT, LP_FIELDS))
+
+
+def _records_df(
+    content: bytes | mmap.mmap, offsets: list[int], dtype: np.dtype, fields: tuple[str, ...]
+) -> pd.DataFrame:
+    """Build the frame for one record type from the byte offsets of its headers."""
+    if not offsets:
+        return pd.DataFrame()
+
+    # Columns keep the on-disk widths: uint32/float32 payload fields, float64 times
+    records = gather_records(content, offsets, dtype)
+    columns = {name: records[name] for name in (*fields, *TIME_COLUMNS)}
+    return validate_time_columns(pd.DataFrame(columns, copy=False), TIME_COLUMNS)
+
+
 class ROSSFile:
     """Parser for ROSS engine binary stats (PE/KP/LP records).
 
@@ -162,8 +130,7 @@ class ROSSFile:
     """
 
     def __init__(self, filename: Path) -> None:
-        with filename.open("rb") as f:
-            self.content: bytes = f.read()
+        self.content: bytes | mmap.mmap = map_file(filename)
 
         self.metadata_struct: Struct = META_STRUCT
         self.metadata_size: int = META_STRUCT.size
@@ -185,66 +152,51 @@ class ROSSFile:
         self._lp_df: pd.DataFrame | None = None
         self._min_time: float | None = None
         self._max_time: float | None = None
+        self._pe_engine_df_cache: (
+            tuple[pd.DataFrame, tuple[str, float, float], pd.DataFrame] | None
+        ) = None
+        self._sorted_time_cache: tuple[pd.DataFrame, dict[str, bool]] | None = None
+
+    def close(self) -> None:
+        """Release the memory-mapped file, if one was opened."""
+        if isinstance(self.content, mmap.mmap):
+            self.content.close()
 
     def read(self) -> None:
-        pe_list: list[pd.DataFrame] = []
-        kp_list: list[pd.DataFrame] = []
-        lp_list: list[pd.DataFrame] = []
+        pe_offsets: list[int] = []
+        kp_offsets: list[int] = []
+        lp_offsets: list[int] = []
+        content = self.content
+        n = len(content)
+        metadata_size = self.metadata_size
+        unpack_metadata = self.metadata_struct.unpack_from
+        # Payload size -> append for that record type's offsets; one dict hit per record
+        add_offset = {
+            self._proc_elem_size: pe_offsets.append,
+            self._kernel_proc_size: kp_offsets.append,
+            self.lp_size: lp_offsets.append,
+        }.get
         byte_pos = 0
 
-        while byte_pos + self.metadata_size <= len(self.content):
-            metadata_tuple = self.metadata_struct.unpack_from(self.content, byte_pos)
-            byte_pos += self.metadata_size
-            metadata = META(*metadata_tuple)
-
-            if metadata.sample_size == self._proc_elem_size and (
-                byte_pos + self._proc_elem_size
-            ) <= len(self.content):
-                pe_tuple = self._proc_elem_struct.unpack_from(self.content, byte_pos)
-                byte_pos += self._proc_elem_size
-                pe_data = PE(*pe_tuple)
-                df = pd.DataFrame([pe_data])
-                df["virtual_time"] = metadata.virtual_time
-                df["real_time"] = metadata.real_time
-                pe_list.append(df)
-            elif metadata.sample_size == self._kernel_proc_size and (
-                byte_pos + self._kernel_proc_size
-            ) <= len(self.content):
-                kp_tuple = self._kernel_proc_struct.unpack_from(self.content, byte_pos)
-                byte_pos += self._kernel_proc_size
-                kp_data = KP(*kp_tuple)
-                df = pd.DataFrame([kp_data])
-                df["virtual_time"] = metadata.virtual_time
-                df["real_time"] = metadata.real_time
-                kp_list.append(df)
-            elif metadata.sample_size == self.lp_size and (byte_pos + self.lp_size) <= len(
-                self.content
-            ):
-                lp_tuple = self.lp_struct.unpack_from(self.content, byte_pos)
-                byte_pos += self.lp_size
-                lp_data = LP(*lp_tuple)
-                df = pd.DataFrame([lp_data])
-                df["virtual_time"] = metadata.virtual_time
-                df["real_time"] = metadata.real_time
-                lp_list.append(df)
-            else:
-                remaining = len(self.content) - byte_pos
+        # Only the headers are decoded here; the records are gathered per type with numpy
+        while byte_pos + metadata_size <= n:
+            sample_size = unpack_metadata(content, byte_pos)[1]
+            payload_pos = byte_pos + metadata_size
+            add = add_offset(sample_size)
+            if add is None or payload_pos + sample_size > n:
                 logger.warning(
                     "Stopping parse due to invalid payload size: size=%d, remaining=%d",
-                    metadata.sample_size,
-                    remaining,
+                    sample_size,
+                    n - payload_pos,
                 )
                 break
 
-        self.pe_df = validate_time_columns(
-            pd.concat(pe_list, ignore_index=True) if pe_list else pd.DataFrame(), TIME_COLUMNS
-        )
-        self.kp_df = validate_time_columns(
-            pd.concat(kp_list, ignore_index=True) if kp_list else pd.DataFrame(), TIME_COLUMNS
-        )
-        self.lp_df = validate_time_columns(
-            pd.concat(lp_list, ignore_index=True) if lp_list else pd.DataFrame(), TIME_COLUMNS
-        )
+            add(byte_pos)
+            byte_pos = payload_pos + sample_size
+
+        self.pe_df = _records_df(content, pe_offsets, PE_RECORD_DTYPE, PE_FIELDS)
+        self.kp_df = _records_df(content, kp_offsets, KP_RECORD_DTYPE, KP_FIELDS)
+        self.lp_df = _records_df(content, lp_offsets, LP_RECORD_DTYPE, LP_FIELDS)
 
         if not self.pe_df.empty:
             self.min_time = float(self.pe_df[self.time_variable].min())
@@ -309,13 +261,40 @@ class ROSSFile:
 
     @property
     def pe_engine_df(self) -> pd.DataFrame:
-        if self.pe_df.empty or self.min_time is None or self.max_time is None:
+        df = self._pe_df
+        if df is None or df.empty or self._min_time is None or self._max_time is None:
             return pd.DataFrame()
 
-        return self.pe_df[
-            (self.pe_df[self.time_variable] >= self.min_time)
-            & (self.pe_df[self.time_variable] <= self.max_time)
-        ]
+        # Reuse the last filtered frame while pe_df and the time range are unchanged. Callers
+        # get a shallow copy, so adding or replacing columns does not change the parser's state
+        key = (self._time_variable, self._min_time, self._max_time)
+        if self._pe_engine_df_cache is not None:
+            cached_df, cached_key, cached_engine_df = self._pe_engine_df_cache
+            if cached_df is df and cached_key == key:
+                return cached_engine_df.copy(deep=False)
+
+        times = df[self._time_variable].to_numpy()
+        if self._time_is_sorted(df):
+            # ROSS writes samples in time order, so the range is found by binary search
+            start = np.searchsorted(times, self._min_time, side="left")
+            stop = np.searchsorted(times, self._max_time, side="right")
+            engine_df = df.iloc[start:stop]
+        else:
+            mask = times >= self._min_time
+            np.logical_and(mask, times <= self._max_time, out=mask)
+            # The default range covers every row; skip copying the whole frame for it
+            engine_df = df if mask.all() else df.iloc[mask]
+        self._pe_engine_df_cache = (df, key, engine_df)
+        return engine_df.copy(deep=False)
+
+    def _time_is_sorted(self, df: pd.DataFrame) -> bool:
+        """Whether the active time column of df is non-decreasing, checked once per frame."""
+        if self._sorted_time_cache is None or self._sorted_time_cache[0] is not df:
+            self._sorted_time_cache = (df, {})
+        checked = self._sorted_time_cache[1]
+        if self._time_variable not in checked:
+            checked[self._time_variable] = bool(df[self._time_variable].is_monotonic_increasing)
+        return checked[self._time_variable]
 
     def reset_time_range(self) -> None:
         if self.pe_df.empty:
@@ -335,3 +314,39 @@ class ROSSFile:
         self._use_virtual_time = flag
         self.time_variable = "virtual_time" if flag else "real_time"
         self.reset_time_range()
+
+
+def _read_ross_frames(filename: Path) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    with closing_mapped(ROSSFile(filename)) as ross_file:
+        ross_file.read()
+    return ross_file.pe_df, ross_file.kp_df, ross_file.lp_df
+
+
+def parse_many(
+    filenames: Iterable[Path], max_workers: int | None = None
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Read several ROSS stats files (e.g. one per rank) in parallel and combine their frames.
+
+    The header scan in read() is Python code that holds the GIL, so files are read in worker
+    processes; only the decoded PE/KP/LP frames are sent back. Rows keep the input file order.
+    """
+    filenames = list(filenames)
+    if not filenames:
+        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+
+    # Callers (web and Celery workers) run threads, which are not safe to fork, so workers are
+    # started fresh
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+        frames = list(executor.map(_read_ross_frames, filenames))
+
+    pe_frames, kp_frames, lp_frames = zip(*frames, strict=True)
+    return _concat_frames(pe_frames), _concat_frames(kp_frames), _concat_frames(lp_frames)
+
+
+def _concat_frames(frames: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    # Files without records of a type yield column-less frames, which would widen the dtypes
+    non_empty = [df for df in frames if not df.empty]
+    if not non_empty:
+        return pd.DataFrame()
+    return pd.concat(non_empty, ignore_index=True)
@@ -1,25 +1,157 @@
 from __future__ import annotations
 
-from contextlib import suppress
+from contextlib import contextmanager, suppress
+from functools import cache
+import mmap
+import re
 import struct
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Protocol
 
 import numpy as np
 import pandas as pd
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable
+    from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
+    from pathlib import Path
 
 # Default endianness
 ENDIAN: str = "@"
 LITTLE_ENDIAN = "<"
 BIG_ENDIAN = ">"
 
+# Elements per block in min_max(); small enough for a block to stay in L2 cache
+MIN_MAX_BLOCK_SIZE = 1 << 15
+
+# struct byte-order prefixes and their numpy equivalents
+_NUMPY_BYTE_ORDER = {"@": "=", "=": "=", "<": "<", ">": ">", "!": ">"}
+# numpy kind for each supported struct format character; sizes are taken from struct itself
+_NUMPY_KIND = {
+    "b": "i",
+    "B": "u",
+    "h": "i",
+    "H": "u",
+    "i": "i",
+    "I": "u",
+    "l": "i",
+    "L": "u",
+    "q": "i",
+    "Q": "u",
+    "f": "f",
+    "d": "f",
+}
+_FORMAT_TOKEN = re.compile(r"(\d*)([a-zA-Z])")
+
+
+def map_file(path: Path) -> bytes | mmap.mmap:
+    """Map a file read-only instead of copying it into memory.
+
+    Pages are loaded lazily by the OS and can be shared with np.frombuffer without a copy.
+    The parsers walk the mapping front to back, so the kernel is told to read ahead
+    aggressively where madvise is available. Empty files cannot be mapped, so they are
+    returned as empty bytes.
+    """
+    with path.open("rb") as f:
+        if not path.stat().st_size:
+            return b""
+        # The mapping keeps its own handle, so the file can be closed right away
+        content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        # Only a hint; platforms that reject it still read the file correctly
+        with suppress(OSError):
+            content.madvise(mmap.MADV_SEQUENTIAL)
+    return content
+
+
+class _Closable(Protocol):
+    def close(self) -> None: ...
+
+
+@contextmanager
+def closing_mapped[T: _Closable](parsed: T) -> Iterator[T]:
+    """Like contextlib.closing(), for a parser holding a map_file() mapping.
+
+    After a parse error the traceback may still hold numpy views into the mapping, and closing
+    it then raises BufferError. That error is suppressed so the parse error propagates; the
+    mapping is released together with the views.
+    """
+    try:
+        yield parsed
+    finally:
+        with suppress(BufferError):
+            parsed.close()
+
+
+def struct_dtype(*layouts: tuple[str, Sequence[str]], skip: Collection[str] = ()) -> np.dtype:
+    """Build a numpy structured dtype matching one or more consecutive struct layouts.
+
+    Each layout is a (struct format, field names) pair. Layouts are placed back to back, the
+    way a header struct followed by its payload struct is written to disk. Field offsets and
+    sizes come from the struct module, so native ("@") formats keep platform widths and padding.
+    Fields named in skip are left out; their bytes are treated as padding.
+    """
+    names: list[str] = []
+    formats: list[str] = []
+    offsets: list[int] = []
+    base = 0
+    for fmt, fields in layouts:
+        order, codes = (fmt[0], fmt[1:]) if fmt[:1] in _NUMPY_BYTE_ORDER else ("@", fmt)
+        chars = [c for count, c in _FORMAT_TOKEN.findall(codes) for _ in range(int(count or 1))]
+        if len(chars) != len(fields):
+            raise ValueError(f"Format {fmt!r} has {len(chars)} fields, got {len(fields)} names")
+
+        for i, (name, char) in enumerate(zip(fields, chars, strict=True)):
+            if name in skip:
+                continue
+            size = struct.calcsize(order + char)
+            names.append(name)
+            formats.append(f"{_NUMPY_BYTE_ORDER[order]}{_NUMPY_KIND[char]}{size}")
+            # struct pads before a field, never after the last one
+            offsets.append(base + struct.calcsize(order + "".join(chars[: i + 1])) - size)
+        base += struct.calcsize(fmt)
+
+    return np.dtype({"names": names, "formats": formats, "offsets": offsets, "itemsize": base})
+
+
+def gather_records(
+    content: bytes | mmap.mmap, offsets: Sequence[int], dtype: np.dtype
+) -> np.ndarray:
+    """Copy the records starting at the given byte offsets into one structured array."""
+    if not offsets:
+        return np.empty(0, dtype=dtype)
+
+    buffer = np.frombuffer(content, dtype=np.uint8)
+    record_bytes = buffer[np.asarray(offsets)[:, None] + np.arange(dtype.itemsize)]
+    return record_bytes.view(dtype).reshape(-1)
+
+
+def min_max(values: np.ndarray) -> tuple[float, float]:
+    """Return the minimum and maximum of a non-empty array in one pass over memory.
+
+    NumPy has no fused min/max reduction, so both are taken block by block while each block
+    is still in cache.
+    """
+    if values.size <= MIN_MAX_BLOCK_SIZE:
+        return float(values.min()), float(values.max())
+
+    low = high = values[0]
+    for start in range(0, values.size, MIN_MAX_BLOCK_SIZE):
+        block = values[start : start + MIN_MAX_BLOCK_SIZE]
+        low = min(low, block.min())
+        high = max(high, block.max())
+    return float(low), float(high)
+
+
+@cache
+def _compiled_struct(fmt: str) -> struct.Struct:
+    """Compile each header format once; infer_endian runs for every file opened."""
+    return struct.Struct(fmt)
+
 
 def infer_endian(
     make_header_format: Callable[[str], str],
     sample_size_index: int,
-    content: bytes,
+    content: bytes | mmap.mmap,
     known_payload_sizes: set[int],
 ) -> str:
     """Try to infer endianness by decoding the header.
@@ -32,8 +164,7 @@ def infer_endian(
         return ENDIAN
 
     for endian in (LITTLE_ENDIAN, BIG_ENDIAN):
-        fmt = make_header_format(endian)
-        hdr = struct.Struct(fmt)
+        hdr = _compiled_struct(make_header_format(endian))
         if len(content) < hdr.size:
             continue
 
@@ -58,15 +189,24 @@ def validate_sample_size(sample_size: int, remaining: int, known: set[int]) -> b
 
 
 def validate_time_columns(df: pd.DataFrame, columns: Iterable[str]) -> pd.DataFrame:
-    """Return a filtered copy where the given time columns are finite numeric values."""
-    if df.empty:
+    """Return the rows where the given time columns are finite numeric values.
+
+    The frame itself is returned when no row is dropped.
+    """
+    present = [col for col in columns if col in df.columns]
+    if df.empty or not present:
         return df
 
-    mask = pd.Series(data=True, index=df.index)
-    for col in columns:
-        if col in df.columns:
-            # Convert column to numeric; non-numeric becomes "NaN"
-            vals = pd.to_numeric(df[col], errors="coerce")
-            # Only finite values are "True"
-            mask &= pd.Series(np.isfinite(vals), index=df.index)
-    return df.loc[mask]
+    mask: np.ndarray | None = None
+    for col in present:
+        series = df[col]
+        if series.dtype.kind != "f":
+            # Non-numeric values become NaN
+            series = pd.to_numeric(series, errors="coerce")
+        finite = np.isfinite(series.to_numpy(dtype=np.float64, na_value=np.nan))
+        if mask is None:
+            mask = finite
+        else:
+            np.logical_and(mask, finite, out=mask)
+
+    return df if mask is None or mask.all() else df.loc[mask]
@@ -0,0 +1,92 @@
+"""OpenAPI schema view for the internal API documentation pages.
+
+Imported by the URLconf on the first docs request, so processes that never serve the docs do
+not load drf-yasg's generator and renderers.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar, override
+
+from django.http import HttpResponse
+from drf_yasg import openapi
+from drf_yasg.generators import OpenAPISchemaGenerator
+from drf_yasg.renderers import SwaggerJSONRenderer
+from drf_yasg.views import get_schema_view
+from rest_framework import permissions
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest
+    from rest_framework.request import Request
+
+# The docs pages and the schema they load are cached for this many seconds
+SCHEMA_CACHE_TIMEOUT = 60 * 60
+
+
+class CachedSchemaGenerator(OpenAPISchemaGenerator):
+    """Generate the OpenAPI schema once per process instead of on every docs request.
+
+    The URLconf does not change while the process runs. A public schema does not depend on
+    the user, only on the host and scheme taken from the request, so those key the cache.
+    """
+
+    _schemas: ClassVar[dict[str | None, openapi.Swagger]] = {}
+
+    @override
+    def get_schema(self, request: Request | None = None, public: bool = False) -> openapi.Swagger:
+        if not public:
+            # Filtered by the requesting user's permissions
+            return super().get_schema(request, public)
+        if self._gen.patterns == []:
+            # drf-yasg renders the Swagger/ReDoc pages with an empty pattern list; that
+            # pathless schema must not be served in place of the real one
+            return super().get_schema(request, public)
+
+        key = request.build_absolute_uri("/") if request is not None else None
+        if key not in self._schemas:
+            self._schemas[key] = super().get_schema(request, public)
+        return self._schemas[key]
+
+
+schema_view = get_schema_view(
+    openapi.Info(
+        title="Net Maestro API",
+        default_version="v1",
+        description=(
+            "**WARNING: Internal API Documentation**\n\n"
+            "These APIs are designed for use by the NetMaestro UI only and are "
+            "subject to change or removal without notice.\n\n"
+            "**Do not build external integrations or scripts against these endpoints.**\n\n"
+            "While API versioning (v1, v2, etc.) is used to manage breaking changes, "
+            "internal APIs may be deprecated at any time."
+        ),
+    ),
+    public=True,
+    permission_classes=(permissions.AllowAny,),
+    generator_class=CachedSchemaGenerator,
+)
+
+_schema_json_view = schema_view.as_view(renderer_classes=(SwaggerJSONRenderer,))
+
+# Encoded schema bodies, keyed like CachedSchemaGenerator._schemas
+_schema_json: dict[str, bytes] = {}
+
+
+def openapi_json(request: HttpRequest) -> HttpResponse:
+    """Serve the public schema as JSON, rendered once per host rather than on every request.
+
+    The docs pages load the schema from here (see SPEC_URL in the settings).
+    """
+    key = request.build_absolute_uri("/")
+    if key not in _schema_json:
+        response = _schema_json_view(request)
+        response.render()
+        if response.status_code != 200:
+            return response
+        _schema_json[key] = response.content
+
+    return HttpResponse(
+        _schema_json[key],
+        content_type="application/json",
+        headers={"Cache-Control": f"public, max-age={SCHEMA_CACHE_TIMEOUT}"},
+    )
@@ -8,10 +8,24 @@ Provides endpoints for:
 
 from __future__ import annotations
 
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from functools import lru_cache
+import gzip
+import hashlib
+import json
+import logging
+import os
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+import re
+import threading
+from typing import TYPE_CHECKING
+import zlib
 
 from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
 import pandas as pd
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -20,11 +34,16 @@ from rest_framework.views import APIView
 from net_maestro.core.parsers.event_trace_file import EventFileParser
 from net_maestro.core.parsers.model_file import ModelFile
 from net_maestro.core.parsers.ross_binary_file import ROSSFile
+from net_maestro.core.parsers.schema import closing_mapped
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     import pandas as pd
     from rest_framework.request import Request
 
+logger = logging.getLogger(__name__)
+
 BASE_DIR = Path(settings.BASE_DIR)
 DATA_DIR = BASE_DIR / "data"
 
@@ -42,17 +61,38 @@ _SESSION_KEYS: dict[str, str] = {
     "simulations": "current_simulation_file",
 }
 
+# Category directories with symlinks resolved once, for the path traversal check
+_RESOLVED_SUBDIRS: dict[str, Path] = {
+    subdir: (DATA_DIR / subdir).resolve() for subdir in _SESSION_KEYS
+}
+
 
 def _list_files(*, subdir: str) -> list[str]:
     """List all files in the specified data subdirectory.
 
+    The listing is reused until the directory's mtime changes, which happens whenever an
+    entry is added, removed or renamed.
+
     Returns:
         Sorted list of filenames (not full paths)
     """
-    directory = DATA_DIR / subdir
-    if not directory.exists() or not directory.is_dir():
+    try:
+        mtime_ns = (DATA_DIR / subdir).stat().st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    return sorted([path.name for path in directory.iterdir() if path.is_file()])
+    # Copy so callers cannot modify the cached listing
+    return list(_scan_files(subdir, mtime_ns))
+
+
+@lru_cache(maxsize=16)
+def _scan_files(subdir: str, mtime_ns: int) -> tuple[str, ...]:
+    """Scan a data subdirectory; mtime_ns is only part of the cache key."""
+    try:
+        with os.scandir(DATA_DIR / subdir) as entries:
+            # DirEntry.is_file() uses the type from the directory listing where available
+            return tuple(sorted(entry.name for entry in entries if entry.is_file()))
+    except NotADirectoryError:
+        return ()
 
 
 def _get_selected_file(*, request: Request, subdir: str, available: list[str]) -> str | None:
@@ -116,25 +156,192 @@ def _resolve_selected_path(
     if not requested_name:
         return None, None, None
 
+    # Security check: only plain file names are accepted, so separators and dot entries are
+    # rejected before touching the filesystem
+    if requested_name in {".", ".."} or "/" in requested_name or "\\" in requested_name:
+        return None, requested_name, "Invalid file selection"
+
     # Validate file exists
     candidate = DATA_DIR / subdir / requested_name
-    if not candidate.exists() or not candidate.is_file():
+    if not candidate.is_file():
         return None, requested_name, f"Missing file: {requested_name}"
 
-    # Security check: prevent arbitrary path traversal
-    if candidate.parent.resolve() != (DATA_DIR / subdir).resolve():
+    # Security check: the file must be a direct child of the category directory. Only the
+    # parent is resolved, so data files may be symlinks to elsewhere (e.g. /host_data)
+    if candidate.parent.resolve() != _RESOLVED_SUBDIRS[subdir]:
         return None, requested_name, "Invalid file selection"
 
     return candidate, requested_name, None
 
 
-def _df_records(df: pd.DataFrame) -> list[dict[str, Any]]:
-    """Convert a pandas DataFrame to a list of record dictionaries.
+# Parsed frames kept per loader; keyed on file stats so a rewritten file is parsed again
+_PARSED_CACHE_SIZE = 8
+# Seconds a serialized payload stays in Django's cache
+_JSON_CACHE_TIMEOUT = 60 * 60
+# Same level GZipMiddleware uses
+_GZIP_LEVEL = 6
+_ACCEPTS_GZIP = re.compile(r"\bgzip\b")
+
+
+@lru_cache(maxsize=_PARSED_CACHE_SIZE)
+def _load_event_df(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Parse an event trace file and return its network DataFrame.
+
+    mtime_ns and size are only part of the cache key.
+    """
+    with closing_mapped(EventFileParser(Path(path))) as parser:
+        parser.read()
+        return parser.network_df
+
+
+@lru_cache(maxsize=_PARSED_CACHE_SIZE)
+def _load_model_df(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Parse a model file and return its network DataFrame.
+
+    mtime_ns and size are only part of the cache key.
+    """
+    with closing_mapped(ModelFile(Path(path))) as model_file:
+        model_file.read()
+        return model_file.network_df
+
+
+@lru_cache(maxsize=_PARSED_CACHE_SIZE)
+def _load_ross_df(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Parse a ROSS stats file and return its PE engine DataFrame.
+
+    mtime_ns and size are only part of the cache key.
+    """
+    with closing_mapped(ROSSFile(Path(path))) as ross_file:
+        ross_file.read()
+        return ross_file.pe_engine_df
+
+
+def _json_body(df: pd.DataFrame, file_name: str) -> bytes:
+    """Serialize a DataFrame as a JSON object with 'file', 'columns' and 'data' keys.
+
+    The records are encoded directly by pandas, skipping the intermediate list of
+    dictionaries that a DRF Response would serialize a second time.
+
+    Returns:
+        UTF-8 encoded JSON body
+    """
+    # Drop the closing brace so the records can be appended as the last key
+    preamble = json.dumps({"file": file_name, "columns": list(df.columns)})[:-1]
+    data = df.to_json(orient="records", date_format="iso", double_precision=15)
+    return f'{preamble}, "data": {data}}}'.encode()
+
+
+# Frame loader for each data category
+_LOADERS: dict[str, Callable[[str, int, int], pd.DataFrame]] = {
+    "events": _load_event_df,
+    "models": _load_model_df,
+    "simulations": _load_ross_df,
+}
+
+# Payloads are prefetched off the request thread when a file is selected
+_prefetch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="data-api-prefetch")
+_pending_payloads: dict[str, Future[bytes]] = {}
+_pending_lock = threading.Lock()
+# Most recent prefetch per category; superseded when another file is selected
+_latest_prefetch: dict[str, Future[bytes]] = {}
+
+
+def _payload_key(subdir: str, path: Path, stat: os.stat_result) -> str:
+    # File names may hold spaces or control characters, which cache backends reject in keys
+    name = hashlib.sha1(path.name.encode(), usedforsecurity=False).hexdigest()
+    return f"data_api_gzip:{subdir}:{name}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _build_payload(subdir: str, path: Path, stat: os.stat_result) -> bytes:
+    """Parse, serialize and gzip a data file, storing the compressed body in Django's cache."""
+    df = _LOADERS[subdir](str(path), stat.st_mtime_ns, stat.st_size)
+    # mtime=0 keeps the compressed bytes identical for identical payloads
+    body = gzip.compress(_json_body(df, path.name), compresslevel=_GZIP_LEVEL, mtime=0)
+    cache.set(_payload_key(subdir, path, stat), body, timeout=_JSON_CACHE_TIMEOUT)
+    return body
+
+
+def _file_json_response(*, request: Request, subdir: str, path: Path) -> HttpResponse:
+    """Return the JSON payload for a data file, serialized once per file version.
+
+    The encoded body is stored gzip-compressed in Django's cache under the file's mtime and
+    size, so repeat requests for an unchanged file skip parsing, serialization and
+    compression; it is only decompressed for clients that do not accept gzip. A payload that is
+    still being prefetched is waited on rather than built a second time. The response carries
+    ETag and Last-Modified headers for the file version, and conditional requests that still
+    match it get a 304 without the payload being looked up at all.
 
     Returns:
-        List of dictionaries, one per row, with column names as keys
+        HttpResponse with the JSON body, or HttpResponseNotModified
     """
-    return df.to_dict(orient="records")
+    stat = path.stat()
+    # The same URL serves whichever file the session selects, so the name is part of the tag
+    etag = f'"{zlib.crc32(path.name.encode()):x}-{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    last_modified = int(stat.st_mtime)
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if not_modified is not None:
+        # A 304 repeats the validators and Vary header the full response would have sent
+        return _add_version_headers(not_modified, etag=etag, last_modified=last_modified)
+
+    key = _payload_key(subdir, path, stat)
+    body = cache.get(key)
+    if body is None:
+        with _pending_lock:
+            pending = _pending_payloads.get(key)
+        try:
+            body = pending.result() if pending is not None else _build_payload(subdir, path, stat)
+        except CancelledError:
+            # A newer selection in the category dropped the queued prefetch
+            body = _build_payload(subdir, path, stat)
+    if _ACCEPTS_GZIP.search(request.META.get("HTTP_ACCEPT_ENCODING", "")):
+        response = HttpResponse(body, content_type="application/json")
+        # GZipMiddleware leaves responses that already have a Content-Encoding alone
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response = HttpResponse(gzip.decompress(body), content_type="application/json")
+    return _add_version_headers(response, etag=etag, last_modified=last_modified)
+
+
+def _add_version_headers(response: HttpResponse, *, etag: str, last_modified: int) -> HttpResponse:
+    patch_vary_headers(response, ("Accept-Encoding",))
+    response.headers["ETag"] = etag
+    response.headers["Last-Modified"] = http_date(last_modified)
+    return response
+
+
+def _prefetch_payload(*, subdir: str, path: Path) -> None:
+    """Start building the payload for a data file in the background, if it is not cached.
+
+    Only the latest selection per category is worth building: an earlier prefetch for the
+    category that has not started yet is cancelled, so clicking through files does not queue
+    a parse for each of them.
+    """
+    stat = path.stat()
+    key = _payload_key(subdir, path, stat)
+    if cache.get(key) is not None:
+        return
+
+    with _pending_lock:
+        if key in _pending_payloads:
+            return
+        previous = _latest_prefetch.get(subdir)
+        future = _prefetch_executor.submit(_build_payload, subdir, path, stat)
+        _pending_payloads[key] = future
+        _latest_prefetch[subdir] = future
+    # Outside the lock: a cancelled future runs its done callback, which takes the lock, at once
+    if previous is not None:
+        previous.cancel()
+    future.add_done_callback(lambda done: _prefetch_done(subdir, key, done))
+
+
+def _prefetch_done(subdir: str, key: str, future: Future[bytes]) -> None:
+    with _pending_lock:
+        _pending_payloads.pop(key, None)
+        if _latest_prefetch.get(subdir) is future:
+            del _latest_prefetch[subdir]
+    # Nobody may wait on the result, so a failure would otherwise go unnoticed
+    if not future.cancelled() and (error := future.exception()) is not None:
+        logger.error("Prefetching the %s payload failed", subdir, exc_info=error)
 
 
 class EventDataView(APIView):
@@ -149,7 +356,7 @@ class EventDataView(APIView):
     Do not build external integrations against this endpoint.
     """
 
-    def get(self, request: Request) -> Response:
+    def get(self, request: Request) -> Response | HttpResponse:
         """Parse and return event trace data from the selected binary file.
 
         Query params:
@@ -158,9 +365,11 @@ class EventDataView(APIView):
         Returns:
             JSON with 'file', 'columns', and 'data' keys, or 404 if file not found
         """
-        # Ensure a file is selected (with fallback to defaults/first available)
-        available = _list_files(subdir="events")
-        _get_selected_file(request=request, subdir="events", available=available)
+        # Without an explicit file, ensure one is selected (with fallback to defaults/first
+        # available)
+        if not request.query_params.get("file"):
+            available = _list_files(subdir="events")
+            _get_selected_file(request=request, subdir="events", available=available)
 
         # Now resolve the path (either from query param or the selected file)
         path, requested_name, error = _resolve_selected_path(
@@ -175,16 +384,8 @@ class EventDataView(APIView):
                 detail = f"{detail} ({requested_name})"
             return Response({"detail": detail}, status=404)
 
-        # Parse binary file and return network DataFrame as JSON
-        parser = EventFileParser(path)
-        df = parser.network_df
-        return Response(
-            {
-                "file": path.name,
-                "columns": list(df.columns),
-                "data": _df_records(df),
-            }
-        )
+        # Parse binary file (reused until it changes) and return network DataFrame as JSON
+        return _file_json_response(request=request, subdir="events", path=path)
 
 
 class ModelDataView(APIView):
@@ -199,7 +400,7 @@ class ModelDataView(APIView):
     Do not build external integrations against this endpoint.
     """
 
-    def get(self, request: Request) -> Response:
+    def get(self, request: Request) -> Response | HttpResponse:
         """Parse and return model data from the selected binary file.
 
         Query params:
@@ -208,9 +409,11 @@ class ModelDataView(APIView):
         Returns:
             JSON with 'file', 'columns', and 'data' keys, or 404 if file not found
         """
-        # Ensure a file is selected (with fallback to defaults/first available)
-        available = _list_files(subdir="models")
-        _get_selected_file(request=request, subdir="models", available=available)
+        # Without an explicit file, ensure one is selected (with fallback to defaults/first
+        # available)
+        if not request.query_params.get("file"):
+            available = _list_files(subdir="models")
+            _get_selected_file(request=request, subdir="models", available=available)
 
         # Now resolve the path (either from query param or the selected file)
         path, requested_name, error = _resolve_selected_path(
@@ -225,17 +428,8 @@ class ModelDataView(APIView):
                 detail = f"{detail} ({requested_name})"
             return Response({"detail": detail}, status=404)
 
-        # Parse binary file and return network DataFrame as JSON
-        model_file = ModelFile(path)
-        model_file.read()
-        df = model_file.network_df
-        return Response(
-            {
-                "file": path.name,
-                "columns": list(df.columns),
-                "data": _df_records(df),
-            }
-        )
+        # Parse binary file (reused until it changes) and return network DataFrame as JSON
+        return _file_json_response(request=request, subdir="models", path=path)
 
 
 class RossDataView(APIView):
@@ -250,7 +444,7 @@ class RossDataView(APIView):
     Do not build external integrations against this endpoint.
     """
 
-    def get(self, request: Request) -> Response:
+    def get(self, request: Request) -> Response | HttpResponse:
         """Parse and return ROSS simulation data from the selected binary file.
 
         Query params:
@@ -259,9 +453,11 @@ class RossDataView(APIView):
         Returns:
             JSON with 'file', 'columns', and 'data' keys, or 404 if file not found
         """
-        # Ensure a file is selected (with fallback to defaults/first available)
-        available = _list_files(subdir="simulations")
-        _get_selected_file(request=request, subdir="simulations", available=available)
+        # Without an explicit file, ensure one is selected (with fallback to defaults/first
+        # available)
+        if not request.query_params.get("file"):
+            available = _list_files(subdir="simulations")
+            _get_selected_file(request=request, subdir="simulations", available=available)
 
         # Now resolve the path (either from query param or the selected file)
         path, requested_name, error = _resolve_selected_path(
@@ -276,17 +472,8 @@ class RossDataView(APIView):
                 detail = f"{detail} ({requested_name})"
             return Response({"detail": detail}, status=404)
 
-        # Parse binary file and return PE engine DataFrame as JSON
-        ross_file = ROSSFile(path)
-        ross_file.read()
-        df = ross_file.pe_engine_df
-        return Response(
-            {
-                "file": path.name,
-                "columns": list(df.columns),
-                "data": _df_records(df),
-            }
-        )
+        # Parse binary file (reused until it changes) and return PE engine DataFrame as JSON
+        return _file_json_response(request=request, subdir="simulations", path=path)
 
 
 class DataFilesView(APIView):
@@ -308,42 +495,17 @@ class DataFilesView(APIView):
             JSON with 'files' (available files per category) and 'selected'
             (currently selected file per category)
         """
-        # List available files in each category
-        simulations = _list_files(subdir="simulations")
-        events = _list_files(subdir="events")
-        models = _list_files(subdir="models")
+        # List available files and determine the selection (updating the session if needed)
+        # in one pass over the categories
+        files: dict[str, list[str]] = {}
+        selected: dict[str, str | None] = {}
+        for subdir in ("simulations", "events", "models"):
+            files[subdir] = _list_files(subdir=subdir)
+            selected[subdir] = _get_selected_file(
+                request=request, subdir=subdir, available=files[subdir]
+            )
 
-        # Determine selected file for each category (updates session if needed)
-        selected_simulation = _get_selected_file(
-            request=request,
-            subdir="simulations",
-            available=simulations,
-        )
-        selected_event = _get_selected_file(
-            request=request,
-            subdir="events",
-            available=events,
-        )
-        selected_model = _get_selected_file(
-            request=request,
-            subdir="models",
-            available=models,
-        )
-
-        return Response(
-            {
-                "files": {
-                    "simulations": simulations,
-                    "events": events,
-                    "models": models,
-                },
-                "selected": {
-                    "simulations": selected_simulation,
-                    "events": selected_event,
-                    "models": selected_model,
-                },
-            }
-        )
+        return Response({"files": files, "selected": selected})
 
 
 class SelectDataFileView(APIView):
@@ -386,4 +548,6 @@ class SelectDataFileView(APIView):
 
         # Update session with selected file
         request.session[_SESSION_KEYS[str(category)]] = file_name
+        # Parse the new selection in the background; the dashboard requests it next
+        _prefetch_payload(subdir=str(category), path=DATA_DIR / str(category) / file_name)
         return Response({"selected": {str(category): file_name}})
@@ -1 +0,0 @@
-# from celery import shared_task
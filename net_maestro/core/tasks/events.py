@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from contextlib import suppress
 import logging
+from pathlib import Path
 
 from celery import shared_task
 from django.db import transaction
@@ -11,19 +13,59 @@ from net_maestro.core.parsers.event_trace_file import EventFileParser
 
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT statement when ingesting event records
+EVENT_RECORD_BATCH_SIZE = 10_000
+
 
 @shared_task
 def run_event_task(event_file_pk: int) -> None:
     """Parse event file and ingest records into the database."""
     event_file_model = EventFile.objects.get(pk=event_file_pk)
 
-    with event_file_model.file.open("rb") as f:
-        content = f.read()
+    # Files on local storage are memory-mapped by the parser instead of read into memory
+    source: Path | bytes
+    try:
+        source = Path(event_file_model.file.path)
+    except NotImplementedError:
+        # Remote storage backends have no local path
+        with event_file_model.file.open("rb") as f:
+            source = f.read()
+
+    parser = EventFileParser(source)
+    try:
+        _ingest_event_records(event_file_model, parser)
+    finally:
+        # After an error the traceback may still hold views into the mapping; it is then
+        # released together with them
+        with suppress(BufferError):
+            parser.close()
+
+
+def _ingest_event_records(event_file_model: EventFile, parser: EventFileParser) -> None:
+    # Decode before opening the transaction, so it is only held for the inserts
+    columns = parser.parse_event_columns()
+    total = len(columns["time_step"])
 
+    # One transaction for the whole file: a failed ingest leaves no partial set of records
     with transaction.atomic():
-        parser = EventFileParser(content)
-        batch = [
-            EventRecord(event_file=event_file_model, **rec_dict)
-            for rec_dict in parser.parse_event_records()
-        ]
-        EventRecord.objects.bulk_create(batch)
+        # Build model instances one batch at a time, straight from the decoded columns
+        for start in range(0, total, EVENT_RECORD_BATCH_SIZE):
+            chunk = [
+                column[start : start + EVENT_RECORD_BATCH_SIZE].tolist()
+                for column in columns.values()
+            ]
+            batch = [
+                EventRecord(
+                    event_file=event_file_model,
+                    source_lp=source_lp,
+                    dest_lp=dest_lp,
+                    virtual_send=virtual_send,
+                    virtual_receive=virtual_receive,
+                    event_type=event_type,
+                    time_step=time_step,
+                )
+                for source_lp, dest_lp, virtual_send, virtual_receive, event_type, time_step in zip(
+                    *chunk, strict=True
+                )
+            ]
+            EventRecord.objects.bulk_create(batch)
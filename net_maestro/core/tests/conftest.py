@@ -1,9 +1,62 @@
 from __future__ import annotations
 
+import struct
+from typing import TYPE_CHECKING
+
 import pytest
 from rest_framework.test import APIClient
 
+from net_maestro.core.parsers import model_file, ross_binary_file
+from net_maestro.core.rest import data_api
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 @pytest.fixture
 def api_client() -> APIClient:
     return APIClient()
+
+
+@pytest.fixture
+def tiny_data_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Point the data API at a data/ tree holding a few synthetic records per category.
+
+    Files use the default sample names, so they are selected without any session state.
+    """
+    event_records = [
+        struct.pack("<IIfffI", lp, lp + 1, float(lp), lp + 0.5, 0.0, 4) + struct.pack("<i", 9000)
+        for lp in range(3)
+    ]
+    model_payload = model_file.SIMPLEP2P_STRUCT
+    model_records = [
+        model_file.META_STRUCT.pack(lp, 0, 0, lp + 1.0, lp + 2.0, model_payload.size, 3)
+        + model_payload.pack(lp, 1, 64, 0.5, 2, 128, 1.5)
+        for lp in range(3)
+    ]
+    pe_payload = ross_binary_file.PE_STRUCT
+    ross_records = [
+        ross_binary_file.META_STRUCT.pack(0, pe_payload.size, pe + 1.0, pe + 2.0)
+        + pe_payload.pack(pe, *range(12), *[0.5] * 13)
+        for pe in range(3)
+    ]
+    contents = {
+        "events": b"".join(event_records),
+        "models": b"".join(model_records),
+        "simulations": b"".join(ross_records),
+    }
+
+    data_dir = tmp_path / "data"
+    for subdir, content in contents.items():
+        (data_dir / subdir).mkdir(parents=True)
+        (data_dir / subdir / data_api._DEFAULT_FILES[subdir]).write_bytes(content)
+
+    monkeypatch.setattr(data_api, "DATA_DIR", data_dir)
+    monkeypatch.setattr(
+        data_api,
+        "_RESOLVED_SUBDIRS",
+        {subdir: (data_dir / subdir).resolve() for subdir in contents},
+    )
+    # Listings are memoized on directory mtime alone, which another tree could share
+    data_api._scan_files.cache_clear()
+    return data_dir
@@ -0,0 +1,41 @@
+"""Tests for the API documentation endpoints."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.core.cache import cache
+import pytest
+
+from net_maestro.core.rest import api_docs
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from django.test import Client
+
+
+@pytest.fixture
+def fresh_schema(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Start without any schema memoized by an earlier test."""
+    monkeypatch.setattr(api_docs.CachedSchemaGenerator, "_schemas", {})
+    monkeypatch.setattr(api_docs, "_schema_json", {})
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.parametrize(
+    "schema_url", ["/api/docs/swagger/?format=openapi", "/api/docs/openapi.json"]
+)
+@pytest.mark.django_db
+@pytest.mark.usefixtures("fresh_schema")
+def test_schema_has_paths_after_docs_page(client: Client, schema_url: str) -> None:
+    """Loading a docs page first does not leave an empty schema behind."""
+    page = client.get("/api/docs/swagger/")
+
+    resp = client.get(schema_url)
+
+    assert page.status_code == 200
+    assert resp.status_code == 200
+    assert resp.json()["paths"]
@@ -0,0 +1,145 @@
+"""Tests for the data API helpers behind the data endpoints."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
+from pathlib import Path
+import threading
+from typing import TYPE_CHECKING
+
+from django.core.cache.backends.base import memcache_key_warnings
+import numpy as np
+import pytest
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from net_maestro.core.parsers import ross_binary_file
+from net_maestro.core.rest import data_api
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def test_payload_key_is_valid_for_any_file_name() -> None:
+    """File names with spaces or control characters still make portable cache keys."""
+    key = data_api._payload_key("events", Path("run 1\tevents.bin"), os.stat_result((0,) * 10))
+
+    assert not list(memcache_key_warnings(key))
+
+
+@pytest.fixture
+def data_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    data_dir = tmp_path / "data"
+    (data_dir / "events").mkdir(parents=True)
+    monkeypatch.setattr(data_api, "DATA_DIR", data_dir)
+    monkeypatch.setattr(data_api, "_RESOLVED_SUBDIRS", {"events": (data_dir / "events").resolve()})
+    return data_dir
+
+
+def _resolve(name: str) -> tuple[Path | None, str | None, str | None]:
+    request = Request(APIRequestFactory().get("/", {"file": name}))
+    return data_api._resolve_selected_path(
+        request=request, subdir="events", session_key="current_event_file", query_param="file"
+    )
+
+
+def test_resolve_accepts_symlinked_file(data_dir: Path) -> None:
+    """A data file may link to a file outside data/, as in the README's host data setups."""
+    target = data_dir.parent / "host_data" / "ev.bin"
+    target.parent.mkdir()
+    target.write_bytes(b"")
+    (data_dir / "events" / "ev.bin").symlink_to(target)
+
+    assert _resolve("ev.bin") == (data_dir / "events" / "ev.bin", "ev.bin", None)
+
+
+@pytest.mark.parametrize("name", ["..", "../events/ev.bin", "ev\\..\\ev.bin"])
+def test_resolve_rejects_paths(data_dir: Path, name: str) -> None:
+    (data_dir / "events" / "ev.bin").write_bytes(b"")
+
+    assert _resolve(name) == (None, name, "Invalid file selection")
+
+
+@pytest.fixture
+def fresh_loaders() -> Iterator[None]:
+    data_api._load_ross_df.cache_clear()
+    yield
+    data_api._load_ross_df.cache_clear()
+
+
+@pytest.mark.usefixtures("fresh_loaders")
+def test_loader_parse_error_is_not_masked(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """A parse error propagates even while a view still pins the mapping."""
+    path = tmp_path / "ross.bin"
+    path.write_bytes(
+        ross_binary_file.META_STRUCT.pack(0, ross_binary_file.LP_STRUCT.size, 1.0, 2.0)
+        + ross_binary_file.LP_STRUCT.pack(*range(8), 0.5)
+    )
+
+    def corrupt_records(content: bytes, *args: object) -> np.ndarray:
+        view = np.frombuffer(content, dtype=np.uint8)
+        msg = f"corrupt record in {view.size} bytes"
+        raise ValueError(msg)
+
+    monkeypatch.setattr(ross_binary_file, "gather_records", corrupt_records)
+
+    with pytest.raises(ValueError, match="corrupt record"):
+        data_api._load_ross_df(str(path), 0, 0)
+
+
+def test_failed_prefetch_is_logged(
+    caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """A prefetch nobody waits on still reports its failure."""
+    path = tmp_path / "events.bin"
+    path.write_bytes(b"unreadable")
+
+    def fail(*args: object) -> bytes:
+        msg = "unreadable"
+        raise OSError(msg)
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(data_api, "_prefetch_executor", executor)
+    monkeypatch.setattr(data_api, "_build_payload", fail)
+
+    with caplog.at_level(logging.ERROR, logger=data_api.__name__):
+        data_api._prefetch_payload(subdir="events", path=path)
+        # Done callbacks run on the worker thread before it finishes
+        executor.shutdown(wait=True)
+
+    assert "Prefetching the events payload failed" in caplog.text
+    assert not data_api._pending_payloads
+
+
+def test_newer_selection_cancels_queued_prefetch(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Selecting another file in a category drops the earlier prefetch if it has not started."""
+    first_path, second_path = tmp_path / "first.bin", tmp_path / "second.bin"
+    first_path.write_bytes(b"first")
+    second_path.write_bytes(b"second")
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(data_api, "_prefetch_executor", executor)
+
+    def build(*args: object) -> bytes:
+        return b""
+
+    monkeypatch.setattr(data_api, "_build_payload", build)
+    # Keep the only worker busy so both prefetches queue behind it
+    release = threading.Event()
+    executor.submit(release.wait)
+
+    data_api._prefetch_payload(subdir="events", path=first_path)
+    first = data_api._latest_prefetch["events"]
+    data_api._prefetch_payload(subdir="events", path=second_path)
+    second = data_api._latest_prefetch["events"]
+    release.set()
+    executor.shutdown(wait=True)
+
+    assert first.cancelled()
+    assert second.result() == b""
+    assert not data_api._pending_payloads
+    assert not data_api._latest_prefetch
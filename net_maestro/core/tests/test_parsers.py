@@ -0,0 +1,231 @@
+"""Tests for the binary file parsers."""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from net_maestro.core.parsers import ross_binary_file
+from net_maestro.core.parsers.event_trace_file import EVENT_RECORD_DTYPES, EventFileParser
+from net_maestro.core.parsers.model_file import (
+    META_STRUCT,
+    SIMPLEP2P_STRUCT,
+    ModelFile,
+    parse_many,
+)
+from net_maestro.core.parsers.ross_binary_file import KP_STRUCT, LP_STRUCT, PE_STRUCT, ROSSFile
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _event_record(source_lp: int, dest_lp: int, send: float, receive: float, event: int) -> bytes:
+    return struct.pack("<IIfffI", source_lp, dest_lp, send, receive, 0.0, 4) + struct.pack(
+        "<i", event
+    )
+
+
+def test_event_parser_vectorized_matches_records() -> None:
+    """The vectorized SimpleP2P path produces the same frame as the record generator."""
+    content = b"".join(
+        _event_record(lp, lp + 1, float(lp), float(lp) + 0.5, 9000 + lp) for lp in range(5)
+    )
+    parser = EventFileParser(content)
+    parser.read()
+
+    expected = pd.DataFrame(list(parser.parse_event_records())).astype(EVENT_RECORD_DTYPES)
+    pd.testing.assert_frame_equal(parser.simplep2p_df, expected)
+    assert parser.min_time == 0.0
+    assert parser.max_time == 4.0
+
+
+def test_event_parser_gathers_mixed_records() -> None:
+    """Zero-length records are skipped and parsing stops at an unknown payload size."""
+    empty = struct.pack("<IIfffI", 0, 0, 0.0, 0.0, 0.0, 0)
+    unknown = struct.pack("<IIfffI", 0, 0, 0.0, 0.0, 0.0, 12)
+    content = b"".join(
+        [
+            empty,
+            _event_record(0, 1, 1.0, 2.0, 9000),
+            empty,
+            empty,
+            _event_record(1, 2, 3.0, 4.0, 9001),
+            unknown,
+            _event_record(2, 3, 5.0, 6.0, 9002),
+        ]
+    )
+    parser = EventFileParser(content)
+    parser.read()
+
+    expected = pd.DataFrame(list(parser.parse_event_records())).astype(EVENT_RECORD_DTYPES)
+    pd.testing.assert_frame_equal(parser.simplep2p_df, expected)
+    assert parser.simplep2p_df["event_type"].tolist() == [9000, 9001]
+
+
+def test_event_parser_drops_non_finite_times() -> None:
+    """Records with a non-finite send or receive time are excluded from the frame and range."""
+    content = b"".join(
+        [
+            _event_record(0, 1, 1.0, 2.0, 9000),
+            _event_record(1, 2, float("nan"), 3.0, 9001),
+            _event_record(2, 3, 5.0, float("inf"), 9002),
+            _event_record(3, 4, 0.5, 7.0, 9003),
+        ]
+    )
+    parser = EventFileParser(content)
+    parser.read()
+
+    assert parser.simplep2p_df["time_step"].tolist() == [0, 3]
+    assert parser.min_time == 0.5
+    assert parser.max_time == 1.0
+
+
+def test_event_parser_explicit_endian() -> None:
+    """A caller-supplied byte order is used instead of detecting it from the header."""
+    content = struct.pack(">IIfffI", 7, 8, 1.5, 2.5, 0.0, 4) + struct.pack(">i", 9000)
+    parser = EventFileParser(content, endian=">")
+    parser.read()
+
+    record = parser.simplep2p_df.iloc[0]
+    assert (record["source_lp"], record["dest_lp"], record["event_type"]) == (7, 8, 9000)
+
+
+def test_event_network_df_is_not_shared() -> None:
+    """Columns a caller adds to network_df do not show up in later results."""
+    content = b"".join(_event_record(lp, lp + 1, float(lp), lp + 0.5, 9000) for lp in range(3))
+    parser = EventFileParser(content)
+    parser.read()
+
+    network_df = parser.network_df
+    network_df["weight"] = 1
+
+    assert "weight" not in parser.network_df.columns
+    assert "weight" not in parser.simplep2p_df.columns
+
+
+def _model_record(lp_id: int, virtual_time: float) -> bytes:
+    return META_STRUCT.pack(
+        lp_id, 0, 0, virtual_time, virtual_time * 2, SIMPLEP2P_STRUCT.size, 3
+    ) + SIMPLEP2P_STRUCT.pack(lp_id, 1, 64, 0.5, 2, 128, 1.5)
+
+
+def test_model_parser_stops_at_invalid_record(tmp_path: Path) -> None:
+    """Records after the first non-model-data record, and trailing bytes, are ignored."""
+    records = [_model_record(lp, float(lp + 1)) for lp in range(4)]
+    invalid = META_STRUCT.pack(9, 0, 0, 0.0, 0.0, SIMPLEP2P_STRUCT.size, 1) + bytes(
+        SIMPLEP2P_STRUCT.size
+    )
+    path = tmp_path / "model.bin"
+    path.write_bytes(b"".join([*records[:3], invalid, records[3], bytes(8)]))
+
+    parser = ModelFile(path)
+    parser.read()
+
+    assert parser.simplep2p_df["lp_id"].tolist() == [0, 1, 2]
+    assert (parser.min_time, parser.max_time) == (1.0, 3.0)
+
+
+def test_model_parse_many_keeps_order(tmp_path: Path) -> None:
+    """Files read concurrently come back parsed and in the order given."""
+    paths = []
+    for lp in range(3):
+        path = tmp_path / f"model-{lp}.bin"
+        path.write_bytes(_model_record(lp, float(lp + 1)))
+        paths.append(path)
+
+    parsed = parse_many(paths, max_workers=2)
+
+    assert [model.simplep2p_df["lp_id"].tolist() for model in parsed] == [[0], [1], [2]]
+    for model in parsed:
+        assert isinstance(model.content, mmap.mmap)
+        assert model.content.closed
+
+
+def _ross_record(payload: struct.Struct, time: float, *values: float) -> bytes:
+    return ross_binary_file.META_STRUCT.pack(0, payload.size, time, time * 10) + payload.pack(
+        *values
+    )
+
+
+def test_ross_parser_splits_record_types(tmp_path: Path) -> None:
+    """Records are grouped by payload size and parsing stops at a truncated record."""
+    pe_values = (*range(13), *[0.5] * 13)
+    path = tmp_path / "ross.bin"
+    path.write_bytes(
+        b"".join(
+            [
+                _ross_record(PE_STRUCT, 1.0, *pe_values),
+                _ross_record(KP_STRUCT, 1.0, *range(9), 0.25, 0.75),
+                _ross_record(LP_STRUCT, 1.0, *range(8), 0.5),
+                _ross_record(PE_STRUCT, 2.0, *pe_values),
+                _ross_record(KP_STRUCT, 3.0, *range(9), 0.25, 0.75)[:-4],
+            ]
+        )
+    )
+
+    parser = ROSSFile(path)
+    parser.read()
+
+    assert parser.pe_df["virtual_time"].tolist() == [1.0, 2.0]
+    assert parser.pe_df.columns[-2:].tolist() == ["virtual_time", "real_time"]
+    assert parser.pe_df.dtypes.value_counts().to_dict() == {
+        np.dtype(np.uint32): 13,
+        np.dtype(np.float32): 13,
+        np.dtype(np.float64): 2,
+    }
+    assert parser.kp_df["time_ahead_gvt"].tolist() == [0.25]
+    assert parser.lp_df["LP_ID"].tolist() == [2]
+    assert (parser.min_time, parser.max_time) == (1.0, 2.0)
+
+
+def test_ross_pe_engine_df_is_not_shared(tmp_path: Path) -> None:
+    """Columns a caller adds to pe_engine_df do not reach pe_df or later results."""
+    pe_values = (*range(13), *[0.5] * 13)
+    path = tmp_path / "ross.bin"
+    # Out of time order, with the default range covering every sample
+    path.write_bytes(b"".join(_ross_record(PE_STRUCT, t, *pe_values) for t in (2.0, 1.0, 3.0)))
+    parser = ROSSFile(path)
+    parser.read()
+
+    engine_df = parser.pe_engine_df
+    engine_df["weight"] = 1
+
+    assert "weight" not in parser.pe_engine_df.columns
+    assert "weight" not in parser.pe_df.columns
+
+
+def test_ross_parse_many_combines_files(tmp_path: Path) -> None:
+    """Files parsed in worker processes are combined in the order given."""
+    paths = []
+    for rank in range(3):
+        path = tmp_path / f"ross-{rank}.bin"
+        path.write_bytes(_ross_record(LP_STRUCT, float(rank + 1), 0, 0, rank, *range(5), 0.5))
+        paths.append(path)
+
+    pe_df, kp_df, lp_df = ross_binary_file.parse_many(paths, max_workers=2)
+
+    assert lp_df["LP_ID"].tolist() == [0, 1, 2]
+    assert lp_df["virtual_time"].tolist() == [1.0, 2.0, 3.0]
+    assert pe_df.empty
+    assert kp_df.empty
+
+
+def test_ross_parse_error_is_not_masked(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """A parse error propagates even while a view still pins the mapping."""
+    path = tmp_path / "ross.bin"
+    path.write_bytes(_ross_record(LP_STRUCT, 1.0, 0, 0, 0, *range(5), 0.5))
+
+    def corrupt_records(content: bytes, *args: object) -> np.ndarray:
+        view = np.frombuffer(content, dtype=np.uint8)
+        msg = f"corrupt record in {view.size} bytes"
+        raise ValueError(msg)
+
+    monkeypatch.setattr(ross_binary_file, "gather_records", corrupt_records)
+
+    with pytest.raises(ValueError, match="corrupt record"):
+        ross_binary_file._read_ross_frames(path)
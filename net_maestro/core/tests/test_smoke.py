@@ -1,7 +1,7 @@
 """Smoke tests for data API endpoints.
 
-Note: Tests require sample data files to be present in data/ directories.
-If files are missing, endpoints will return 404 (which will fail these tests).
+The endpoints are served from a few synthetic records per category (see the tiny_data_dir
+fixture), not from the sample data files.
 """
 
 from __future__ import annotations
@@ -11,28 +11,33 @@ from typing import TYPE_CHECKING
 
 import pytest
 
+from net_maestro.core import views
+from net_maestro.core.tests.factories import UserFactory
+
 if TYPE_CHECKING:
+    from django.test import RequestFactory
+    from pytest_django.fixtures import SettingsWrapper
     from rest_framework.test import APIClient
 
-from net_maestro.core.tests.factories import UserFactory
-
 
 @pytest.mark.parametrize("category", ["event", "model", "ross"])
 @pytest.mark.django_db
+@pytest.mark.usefixtures("tiny_data_dir")
 def test_data_endpoints_smoke(api_client: APIClient, category: str) -> None:
     """Smoke test for data API endpoints (event, model, ross).
 
     Verifies that each data endpoint:
     1. Returns HTTP 200 OK
-    2. Returns valid JSON
-    3. Has 'columns' list in response
-    4. Has 'data' list in response
+    2. Has 'columns' list in response
+    3. Has 'data' list in response, as the last key
+
+    Only the small 'file'/'columns' preamble is decoded; the records are checked by shape,
+    so the test does not parse the whole payload.
 
     This test is parametrized to run once for each category (event, model, ross).
 
     Raises:
-        AssertionError: If endpoint returns non-200 status, invalid JSON,
-            or missing expected structure
+        AssertionError: If endpoint returns non-200 status or is missing expected structure
     """
     url = f"/api/v1/data/{category}"
     user = UserFactory.create()
@@ -41,6 +46,41 @@ def test_data_endpoints_smoke(api_client: APIClient, category: str) -> None:
     resp = api_client.get(url)
 
     assert resp.status_code == 200, f"{url} -> {resp.status_code}"
-    payload = json.loads(resp.content.decode("utf-8"))
-    assert isinstance(payload.get("columns"), list), 'missing/invalid "columns" list'
-    assert isinstance(payload.get("data"), list), 'missing/invalid "data" list'
+    preamble, separator, data = resp.content.partition(b', "data": ')
+    assert separator, 'missing "data" key'
+    header = json.loads(preamble + b"}")
+    assert isinstance(header.get("columns"), list), 'missing/invalid "columns" list'
+    assert data.startswith(b"["), 'missing/invalid "data" list'
+    assert data.endswith(b"]}"), '"data" is not the last key'
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("tiny_data_dir")
+def test_data_endpoint_not_modified(api_client: APIClient) -> None:
+    """A conditional request for an unchanged file gets a 304 with the same validators."""
+    api_client.force_authenticate(user=UserFactory.create())
+    full = api_client.get("/api/v1/data/event")
+
+    resp = api_client.get("/api/v1/data/event", HTTP_IF_NONE_MATCH=full["ETag"])
+
+    assert resp.status_code == 304
+    assert not resp.content
+    for header in ("ETag", "Last-Modified", "Vary"):
+        assert resp[header] == full[header], header
+
+
+@pytest.mark.parametrize("encoding", ["gzip", None])
+def test_home_page_encoding(
+    rf: RequestFactory, settings: SettingsWrapper, encoding: str | None
+) -> None:
+    """The home page is sent pre-gzipped, except under DEBUG.
+
+    In development the toolbar and browser reload middleware must see plain HTML, and
+    GZipMiddleware compresses it after them.
+    """
+    settings.DEBUG = encoding is None
+
+    resp = views.home(rf.get("/", HTTP_ACCEPT_ENCODING="gzip"))
+
+    assert resp.get("Content-Encoding") == encoding
+    assert resp["Vary"] == "Accept-Encoding"
@@ -0,0 +1,50 @@
+"""Tests for the Celery ingest tasks."""
+
+from __future__ import annotations
+
+import struct
+from typing import TYPE_CHECKING
+
+from django.core.files.base import ContentFile
+from django.db.models.fields.files import FieldFile
+import pytest
+
+from net_maestro.core.models.event_file import EventFile
+from net_maestro.core.models.event_record import EventRecord
+from net_maestro.core.models.run import Run
+from net_maestro.core.tasks.events import run_event_task
+
+if TYPE_CHECKING:
+    from pytest_django.fixtures import SettingsWrapper
+
+
+@pytest.mark.django_db
+def test_run_event_task_reads_remote_storage(
+    monkeypatch: pytest.MonkeyPatch, settings: SettingsWrapper
+) -> None:
+    """Storage without local paths (S3/MinIO) is read into memory instead of memory-mapped."""
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"},
+    }
+
+    def no_local_path(field_file: FieldFile) -> str:
+        # What the S3 storage backends do
+        raise NotImplementedError
+
+    monkeypatch.setattr(FieldFile, "path", property(no_local_path))
+    content = b"".join(
+        struct.pack("<IIfffI", lp, lp + 1, float(lp), lp + 0.5, 0.0, 4) + struct.pack("<i", 9000)
+        for lp in range(3)
+    )
+    event_file = EventFile(run=Run.objects.create(name="remote"))
+    event_file.file.save("events.bin", ContentFile(content))
+
+    run_event_task(event_file.pk)
+
+    records = EventRecord.objects.filter(event_file=event_file).order_by("time_step")
+    assert list(records.values_list("source_lp", "dest_lp", "time_step")) == [
+        (0, 1, 0),
+        (1, 2, 1),
+        (2, 3, 2),
+    ]
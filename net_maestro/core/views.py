@@ -13,13 +13,56 @@ page reloads.
 
 from __future__ import annotations
 
+from functools import cache
+import gzip
+import re
+from typing import Any
+
+from django.conf import settings
+from django.dispatch import receiver
 from django.http import HttpRequest, HttpResponse
-from django.shortcuts import render
+from django.template import loader
+from django.utils.autoreload import file_changed
+from django.utils.cache import patch_vary_headers
+
+_ACCEPTS_GZIP = re.compile(r"\bgzip\b")
+
+
+@cache
+def _home_body() -> bytes:
+    """Render the main page once; it only uses {% static %}, so it needs no request context.
+
+    Templates can only be loaded once the app registry is ready, so this runs on first use
+    rather than at import time.
+    """
+    return loader.get_template("net_maestro/index.html").render().encode()
+
+
+@cache
+def _home_body_gzip() -> bytes:
+    """Compress the main page once, instead of in GZipMiddleware on every request."""
+    return gzip.compress(_home_body(), compresslevel=9, mtime=0)
+
+
+@receiver(file_changed)
+def _reset_home_body(**kwargs: Any) -> None:
+    # The development autoreloader resets the template loaders on edits; drop the body too
+    _home_body.cache_clear()
+    _home_body_gzip.cache_clear()
 
 
 def home(request: HttpRequest) -> HttpResponse:
-    """Render the main application page with data file selection."""
-    return render(request, "net_maestro/index.html")
+    """Serve the main application page with data file selection."""
+    # The debug toolbar and browser reload middleware only inject into uncompressed HTML, so
+    # in development GZipMiddleware compresses the page after them instead
+    if not settings.DEBUG and _ACCEPTS_GZIP.search(request.META.get("HTTP_ACCEPT_ENCODING", "")):
+        response = HttpResponse(_home_body_gzip())
+        # GZipMiddleware leaves responses that already have a Content-Encoding alone
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response = HttpResponse(_home_body())
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
 
 
 def event_data(request: HttpRequest) -> HttpResponse:
@@ -111,4 +111,10 @@ CORS_ALLOWED_ORIGIN_REGEXES: list[str] = env.list(
     "DJANGO_CORS_ALLOWED_ORIGIN_REGEXES", cast=str, default=[]
 )
 
+# Serve the internal API docs pages; disabling them also skips loading drf-yasg's views
+ENABLE_API_DOCS: bool = env.bool("DJANGO_ENABLE_API_DOCS", default=True)
+# The docs pages fetch the schema from the pre-rendered JSON endpoint, by URL name
+SWAGGER_SETTINGS = {"SPEC_URL": "docs-openapi"}
+REDOC_SETTINGS = {"SPEC_URL": "docs-openapi"}
+
 REST_FRAMEWORK["DEFAULT_PERMISSION_CLASSES"] = ["rest_framework.permissions.IsAuthenticated"]
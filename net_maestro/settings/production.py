@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 
+from boto3.s3.transfer import TransferConfig
 import sentry_sdk
 import sentry_sdk.integrations.celery
 import sentry_sdk.integrations.django
@@ -24,6 +25,12 @@ ALLOWED_HOSTS: list[str] = env.list("DJANGO_ALLOWED_HOSTS", cast=str)
 STORAGES["default"] = {
     "BACKEND": "storages.backends.s3.S3Storage",
 }
+# Large uploads (e.g. event traces from data_ingest) are sent as concurrent multipart chunks
+AWS_S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True,
+)
 
 # sentry_sdk is able to directly use environment variables like 'SENTRY_DSN', but prefix them
 # with 'DJANGO_' to avoid conflicts with other Sentry-using services.
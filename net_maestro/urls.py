@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
 from django.conf import settings
 from django.contrib import admin
 from django.urls import include, path
-from drf_yasg import openapi
-from drf_yasg.views import get_schema_view
-from rest_framework import permissions, routers
+from rest_framework import routers
 
 from net_maestro.core.rest.data_api import (
     DataFilesView,
@@ -17,24 +18,35 @@ from net_maestro.core.rest.data_api import (
 
 from .core import views
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.http import HttpRequest, HttpResponse
+
 router = routers.SimpleRouter()
-# OpenAPI generation
-schema_view = get_schema_view(
-    openapi.Info(
-        title="Net Maestro API",
-        default_version="v1",
-        description=(
-            "**WARNING: Internal API Documentation**\n\n"
-            "These APIs are designed for use by the NetMaestro UI only and are "
-            "subject to change or removal without notice.\n\n"
-            "**Do not build external integrations or scripts against these endpoints.**\n\n"
-            "While API versioning (v1, v2, etc.) is used to manage breaking changes, "
-            "internal APIs may be deprecated at any time."
-        ),
-    ),
-    public=True,
-    permission_classes=(permissions.AllowAny,),
-)
+
+
+@cache
+def _docs_view(renderer: str) -> Callable[..., HttpResponse]:
+    # drf-yasg is only imported once the docs are first requested
+    from net_maestro.core.rest.api_docs import SCHEMA_CACHE_TIMEOUT, schema_view  # noqa: PLC0415
+
+    return schema_view.with_ui(renderer, cache_timeout=SCHEMA_CACHE_TIMEOUT)
+
+
+def docs_redoc(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+    return _docs_view("redoc")(request, *args, **kwargs)
+
+
+def docs_swagger(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+    return _docs_view("swagger")(request, *args, **kwargs)
+
+
+def docs_openapi(request: HttpRequest) -> HttpResponse:
+    from net_maestro.core.rest.api_docs import openapi_json  # noqa: PLC0415
+
+    return openapi_json(request)
+
 
 urlpatterns = [
     path("", views.home, name="home"),
@@ -49,10 +61,15 @@ urlpatterns = [
     path("api/v1/data/ross", RossDataView.as_view(), name="api-data-ross"),
     path("api/v1/data/files", DataFilesView.as_view(), name="api-data-files"),
     path("api/v1/data/select", SelectDataFileView.as_view(), name="api-data-select"),
-    path("api/docs/redoc/", schema_view.with_ui("redoc"), name="docs-redoc"),
-    path("api/docs/swagger/", schema_view.with_ui("swagger"), name="docs-swagger"),
 ]
 
+if settings.ENABLE_API_DOCS:
+    urlpatterns += [
+        path("api/docs/redoc/", docs_redoc, name="docs-redoc"),
+        path("api/docs/swagger/", docs_swagger, name="docs-swagger"),
+        path("api/docs/openapi.json", docs_openapi, name="docs-openapi"),
+    ]
+
 if settings.DEBUG:
     import debug_toolbar.toolbar
 
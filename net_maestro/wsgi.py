@@ -1,5 +1,10 @@
 from __future__ import annotations
 
 from django.core.wsgi import get_wsgi_application
+from django.urls import get_resolver
 
 application = get_wsgi_application()
+
+# Import the URLconf and compile every URL pattern while the worker boots, instead of during
+# the first request it serves
+get_resolver().reverse_dict  # noqa: B018